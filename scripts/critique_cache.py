@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+REFRACT Critique Cache - Persistent cache of LLM critiques.
+Keyed by image content hash, critic name, and prompt version so re-running
+the pipeline over an unchanged photo skips the paid API calls entirely.
+"""
+
+import json
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+def hash_image(image_path: Path) -> str:
+    """Content hash of an image file (stable across renames and re-runs)."""
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(image_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class CritiqueCache:
+    """SQLite-backed cache of critic responses, safe for threaded use."""
+
+    def __init__(self, cache_dir: Path):
+        """Initialize the cache, creating the database if needed."""
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = cache_dir / 'critiques.db'
+
+        # The pipeline's critics run in worker threads; serialize access
+        # with a lock rather than one connection per thread
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS critiques ("
+            " hash TEXT NOT NULL,"
+            " critic TEXT NOT NULL,"
+            " prompt_version INTEGER NOT NULL,"
+            " critique_json TEXT NOT NULL,"
+            " PRIMARY KEY (hash, critic, prompt_version))"
+        )
+        self._conn.commit()
+
+    def get(self, image_hash: str, critic: str, prompt_version: int) -> Optional[Dict[str, Any]]:
+        """Return the cached critique, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT critique_json FROM critiques"
+                " WHERE hash = ? AND critic = ? AND prompt_version = ?",
+                (image_hash, critic, prompt_version)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def put(self, image_hash: str, critic: str, prompt_version: int, critique: Dict[str, Any]):
+        """Store a critique, replacing any previous entry for the key."""
+        payload = json.dumps(critique)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO critiques"
+                " (hash, critic, prompt_version, critique_json)"
+                " VALUES (?, ?, ?, ?)",
+                (image_hash, critic, prompt_version, payload)
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -7,14 +7,63 @@ Creates permanent records and regenerates the static website.
 import os
 import sys
 import json
+import mmap
+import logging
+import itertools
 import shutil
+import hashlib
 import re
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Set
 from jinja2 import Environment, FileSystemLoader
 from PIL import Image
 
+from utils import json_loads, json_dump_bytes, setup_queue_logging
+
+
+log = logging.getLogger('refract.generator')
+
+
+# Metadata files at or above this size are read via mmap
+_MMAP_THRESHOLD = 16 * 1024
+
+# Monotonic suffix for entry IDs created within the same second
+_ENTRY_COUNTER = itertools.count()
+
+
+def _new_entry_id(processed_dir: Path, timestamp: str) -> str:
+    """
+    Build a unique, lexicographically sortable entry ID.
+
+    timestamp + zero-padded counter keeps creation order stable even
+    within one second (a random suffix does not) and avoids a
+    getrandom(2) syscall per entry. The existence check guards against
+    counter resets across process restarts in the same second.
+    """
+    while True:
+        entry_id = f"{timestamp}-{next(_ENTRY_COUNTER):04d}"
+        if not (processed_dir / entry_id).exists():
+            return entry_id
+
+
+def _fast_copy(src: Path, dst: Path):
+    """
+    Publish an image into the site without moving its bytes.
+
+    Skips the copy entirely when the destination is already current,
+    hardlinks when the filesystem allows it (metadata-only), and falls
+    back to copyfile (which uses copy_file_range on Linux) otherwise.
+    """
+    try:
+        if dst.exists() and dst.stat().st_mtime >= src.stat().st_mtime:
+            return
+        dst.unlink(missing_ok=True)
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
 
 class SiteGenerator:
     """Generates documentation and rebuilds the static website."""
@@ -29,10 +78,21 @@ class SiteGenerator:
         self.templates_dir = self.site_dir / 'templates'
         self.public_dir = self.site_dir / 'public'
 
-        # Setup Jinja2
+        # Setup Jinja2; compiled templates are fetched lazily and cached so
+        # per-entry renders don't re-run template lookup
         self.jinja_env = Environment(loader=FileSystemLoader(str(self.templates_dir)))
-
-    def create_entry(self, original_path: Path, edited_path: Path, metadata: Dict[str, Any]) -> Path:
+        self._templates = {}
+
+    def _get_template(self, name: str):
+        """Get a compiled template, caching it for reuse across renders."""
+        template = self._templates.get(name)
+        if template is None:
+            template = self.jinja_env.get_template(name)
+            self._templates[name] = template
+        return template
+
+    def create_entry(self, original_path: Path, edited_path: Path, metadata: Dict[str, Any],
+                     move_edited: bool = False, link_edited: bool = False) -> Path:
         """
         Create a permanent entry for a processed photograph.
 
@@ -40,13 +100,19 @@ class SiteGenerator:
             original_path: Path to original image
             edited_path: Path to edited image
             metadata: Critic's analysis (score, improvements, notes)
+            move_edited: If True, move the edited image into the entry
+                instead of copying (for disposable temp files - saves a
+                full-size write plus the caller's unlink)
+            link_edited: If True, hardlink the edited image into the entry
+                (falling back to copy), leaving the source in place for
+                callers that are still reading it
 
         Returns:
             Path to the created entry directory
         """
         # Generate unique entry ID
         timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-        entry_id = f"{timestamp}-{os.urandom(4).hex()}"
+        entry_id = _new_entry_id(self.processed_dir, timestamp)
         entry_dir = self.processed_dir / entry_id
 
         # Create entry directory
@@ -57,7 +123,17 @@ class SiteGenerator:
         edited_dest = entry_dir / f"edited{edited_path.suffix}"
 
         shutil.copy2(original_path, original_dest)
-        shutil.copy2(edited_path, edited_dest)
+        if link_edited:
+            try:
+                os.link(edited_path, edited_dest)
+            except OSError:
+                shutil.copy2(edited_path, edited_dest)
+        elif move_edited:
+            # Rename when source and destination share a filesystem,
+            # falling back to copy+unlink across devices
+            shutil.move(str(edited_path), str(edited_dest))
+        else:
+            shutil.copy2(edited_path, edited_dest)
 
         # Add metadata
         metadata_with_timestamp = {
@@ -70,13 +146,67 @@ class SiteGenerator:
         }
 
         # Save metadata
-        metadata_path = entry_dir / 'metadata.json'
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata_with_timestamp, f, indent=2)
+        (entry_dir / 'metadata.json').write_bytes(json_dump_bytes(metadata_with_timestamp))
+
+        log.info(f"Created entry: {entry_id}")
+        return entry_dir
+
+    def duplicate_entry(self, source_entry_dir: Path, original_path: Path) -> Path:
+        """
+        Create a new entry that reuses another entry's results.
+
+        Used for inbox files whose bytes match an already-processed image:
+        the critique and edited output are identical, so only the entry's
+        identity fields change.
+
+        Args:
+            source_entry_dir: Entry directory to duplicate
+            original_path: The duplicate image file in the inbox
+
+        Returns:
+            Path to the created entry directory
+        """
+        with open(source_entry_dir / 'metadata.json', 'rb') as f:
+            metadata = json_loads(f.read())
+
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        entry_id = _new_entry_id(self.processed_dir, timestamp)
+        entry_dir = self.processed_dir / entry_id
+        entry_dir.mkdir(parents=True, exist_ok=True)
 
-        print(f"Created entry: {entry_id}")
+        original_dest = entry_dir / f"original{original_path.suffix}"
+        shutil.copy2(original_path, original_dest)
+        edited_name = metadata['edited_image']
+        shutil.copy2(source_entry_dir / edited_name, entry_dir / edited_name)
+
+        metadata.update({
+            'timestamp': timestamp,
+            'entry_id': entry_id,
+            'original_filename': original_path.name,
+            'original_image': original_dest.name,
+            'duplicate_of': source_entry_dir.name,
+        })
+
+        (entry_dir / 'metadata.json').write_bytes(json_dump_bytes(metadata))
+
+        log.info(f"Created duplicate entry: {entry_id} (of {source_entry_dir.name})")
         return entry_dir
 
+    def update_entry(self, entry_dir: Path, updates: Dict[str, Any]) -> None:
+        """
+        Merge additional fields into an entry's saved metadata.
+
+        Used when data (like the re-review) arrives after the entry has
+        already been written to disk.
+        """
+        metadata_path = entry_dir / 'metadata.json'
+        with open(metadata_path, 'rb') as f:
+            metadata = json_loads(f.read())
+
+        metadata.update(updates)
+
+        metadata_path.write_bytes(json_dump_bytes(metadata))
+
     def create_comparison_image(self, original_path: Path, edited_path: Path, output_path: Path):
         """Create a side-by-side comparison image."""
         original = Image.open(original_path)
@@ -87,6 +217,11 @@ class SiteGenerator:
         original_aspect = original.width / original.height
         edited_aspect = edited.width / edited.height
 
+        # draft() lets libjpeg decode JPEGs at a reduced DCT scale, so the
+        # LANCZOS resample starts from far fewer pixels (no-op otherwise)
+        original.draft('RGB', (int(target_height * original_aspect), target_height))
+        edited.draft('RGB', (int(target_height * edited_aspect), target_height))
+
         original_resized = original.resize(
             (int(target_height * original_aspect), target_height),
             Image.Resampling.LANCZOS
@@ -106,17 +241,46 @@ class SiteGenerator:
         comparison.save(output_path, quality=90)
 
     def get_all_entries(self) -> List[Dict[str, Any]]:
-        """Load all processed entries."""
+        """Load all processed entries, newest first."""
         entries = []
 
-        for entry_dir in sorted(self.processed_dir.iterdir(), reverse=True):
-            if entry_dir.is_dir() and not entry_dir.name.startswith('.'):
-                metadata_path = entry_dir / 'metadata.json'
-                if metadata_path.exists():
-                    with open(metadata_path) as f:
-                        metadata = json.load(f)
-                        metadata['path'] = entry_dir
-                        entries.append(metadata)
+        if not self.processed_dir.exists():
+            return entries
+
+        # scandir reuses the dirent type info instead of a stat per entry,
+        # and entry IDs are timestamp-prefixed so a name sort is a time sort
+        with os.scandir(self.processed_dir) as dir_iter:
+            entry_dirs = [
+                e for e in dir_iter
+                if e.is_dir() and not e.name.startswith('.')
+            ]
+
+        for dir_entry in sorted(entry_dirs, key=lambda e: e.name, reverse=True):
+            metadata_path = os.path.join(dir_entry.path, 'metadata.json')
+            try:
+                with open(metadata_path, 'rb') as f:
+                    # Parse and hash large metadata (many critiques /
+                    # re-review blobs) straight out of the mapped page
+                    # cache - both consumers take buffer objects, so no
+                    # user-space copy is made; tiny files aren't worth
+                    # the mmap setup
+                    if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            # memoryview, not bytes: orjson takes the
+                            # buffer zero-copy but rejects raw mmap objects
+                            metadata = json_loads(memoryview(mapped))
+                            digest = hashlib.blake2b(mapped, digest_size=16).hexdigest()
+                    else:
+                        raw = f.read()
+                        metadata = json_loads(raw)
+                        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            except FileNotFoundError:
+                continue
+            metadata['path'] = Path(dir_entry.path)
+            # Content hash of the raw metadata, used by the incremental
+            # build to decide whether the entry page needs re-rendering
+            metadata['_metadata_hash'] = digest
+            entries.append(metadata)
 
         return entries
 
@@ -124,8 +288,11 @@ class SiteGenerator:
         """Remove severity tags like [SUBTLE] from improvement text."""
         if not isinstance(text, str):
             return ""
-        cleaned = self._IMPROVEMENT_TAG_RE.sub("", text).strip()
-        return cleaned
+        # Most improvements carry no tag; a cheap bracket probe skips the
+        # (already precompiled) regex dispatch for them
+        if '[' not in text[:8]:
+            return text.strip()
+        return self._IMPROVEMENT_TAG_RE.sub("", text).strip()
 
     def _clean_improvement_list(self, improvements: Any) -> List[str]:
         """Normalize and clean improvement lists for display."""
@@ -138,21 +305,16 @@ class SiteGenerator:
                 cleaned.append(cleaned_text)
         return cleaned
 
-    def _get_existing_entry_ids(self) -> Set[str]:
-        """Get set of entry IDs that already have generated HTML pages."""
-        existing = set()
-        if not self.public_dir.exists():
-            return existing
+    def _load_build_manifest(self) -> Dict[str, str]:
+        """Load the entry-id -> metadata-hash manifest of the last build."""
+        try:
+            with open(self.public_dir / '.build_manifest.json', 'rb') as f:
+                return json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
 
-        for html_file in self.public_dir.glob('*.html'):
-            # Skip index.html
-            if html_file.name == 'index.html':
-                continue
-            # Extract entry ID from filename (e.g., "20240115-143022-abc12345.html")
-            entry_id = html_file.stem
-            existing.add(entry_id)
-
-        return existing
+    def _save_build_manifest(self, manifest: Dict[str, str]) -> None:
+        (self.public_dir / '.build_manifest.json').write_bytes(json_dump_bytes(manifest))
 
     def _get_existing_images(self) -> Set[str]:
         """Get set of image filenames already in public/images."""
@@ -180,15 +342,18 @@ class SiteGenerator:
         # Get all entries
         entries = self.get_all_entries()
 
-        # Determine what already exists (for incremental builds)
-        existing_entry_ids = set() if force_full else self._get_existing_entry_ids()
+        # Determine what already exists (for incremental builds); the
+        # manifest records the metadata content hash each page was built
+        # from, so touched-but-unchanged entries still skip
+        manifest = {} if force_full else self._load_build_manifest()
+        new_manifest = {}
         existing_images = set() if force_full else self._get_existing_images()
 
         # Copy images to public
         images_dir = self.public_dir / 'images'
         images_dir.mkdir(exist_ok=True)
 
-        new_entries = 0
+        to_render = []
         skipped_entries = 0
 
         for entry in entries:
@@ -219,14 +384,19 @@ class SiteGenerator:
             comparison_dest = images_dir / f"{entry_id}-comparison.jpg"
 
             # Check if this entry needs processing
-            is_new = entry_id not in existing_entry_ids
+            entry_hash = entry.get('_metadata_hash', '')
+            new_manifest[entry_id] = entry_hash
+            entry_page = self.public_dir / f"{entry_id}.html"
+            is_new = (force_full
+                      or manifest.get(entry_id) != entry_hash
+                      or not entry_page.exists())
 
             # Copy images (check each individually)
             if is_new or original_dest.name not in existing_images:
-                shutil.copy2(original_src, original_dest)
+                _fast_copy(original_src, original_dest)
 
             if is_new or edited_dest.name not in existing_images:
-                shutil.copy2(edited_src, edited_dest)
+                _fast_copy(edited_src, edited_dest)
 
             # Create comparison image if needed
             if is_new or comparison_dest.name not in existing_images:
@@ -237,25 +407,41 @@ class SiteGenerator:
             entry['web_edited'] = f"images/{edited_dest.name}"
             entry['web_comparison'] = f"images/{comparison_dest.name}"
 
-            # Generate entry page if new
+            # Queue the entry page for rendering if new or changed
             if is_new:
-                entry_template = self.jinja_env.get_template('entry.html')
-                entry_html = entry_template.render(entry=entry)
-                entry_page = self.public_dir / f"{entry_id}.html"
+                to_render.append((entry, entry_page))
+            else:
+                skipped_entries += 1
+
+        # Render dirty entry pages in parallel - each render is independent
+        # and the file writes release the GIL
+        if to_render:
+            entry_template = self._get_template('entry.html')
 
+            def _render_entry(item):
+                entry, entry_page = item
                 with open(entry_page, 'w') as f:
-                    f.write(entry_html)
-                new_entries += 1
+                    f.write(entry_template.render(entry=entry))
+
+            if len(to_render) > 1:
+                max_workers = min(os.cpu_count() or 1, len(to_render))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for _ in executor.map(_render_entry, to_render):
+                        pass
             else:
-                skipped_entries += 1
+                _render_entry(to_render[0])
+        new_entries = len(to_render)
 
         # Always regenerate index page (shows all entries)
-        template = self.jinja_env.get_template('index.html')
+        template = self._get_template('index.html')
         index_html = template.render(entries=entries, total=len(entries))
 
         with open(self.public_dir / 'index.html', 'w') as f:
             f.write(index_html)
 
+        # Record what this build was based on
+        self._save_build_manifest(new_manifest)
+
         # Copy CSS
         css_src = self.templates_dir / 'style.css'
         css_dest = self.public_dir / 'style.css'
@@ -269,21 +455,22 @@ class SiteGenerator:
                 shutil.copy2(favicon_src, self.public_dir / favicon_name)
 
         if new_entries > 0:
-            print(f"Site built: {new_entries} new entries, {skipped_entries} unchanged")
+            log.info(f"Site built: {new_entries} new entries, {skipped_entries} unchanged")
         else:
-            print(f"Site built successfully: {len(entries)} entries (all unchanged)")
+            log.info(f"Site built successfully: {len(entries)} entries (all unchanged)")
 
 
 def main():
     """CLI interface for the Generator."""
+    setup_queue_logging()
     repo_root = Path(__file__).parent.parent
 
     if len(sys.argv) < 2:
-        print("Usage: generator.py <command> [args]", file=sys.stderr)
-        print("\nCommands:", file=sys.stderr)
-        print("  create <original> <edited> <metadata_json>  - Create new entry", file=sys.stderr)
-        print("  build                                        - Rebuild site (incremental)", file=sys.stderr)
-        print("  build --full                                 - Rebuild site (full)", file=sys.stderr)
+        log.error("Usage: generator.py <command> [args]")
+        log.error("\nCommands:")
+        log.error("  create <original> <edited> <metadata_json>  - Create new entry")
+        log.error("  build                                        - Rebuild site (incremental)")
+        log.error("  build --full                                 - Rebuild site (full)")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -291,7 +478,7 @@ def main():
 
     if command == 'create':
         if len(sys.argv) != 5:
-            print("Usage: generator.py create <original> <edited> <metadata_json>", file=sys.stderr)
+            log.error("Usage: generator.py create <original> <edited> <metadata_json>")
             sys.exit(1)
 
         original_path = Path(sys.argv[2])
@@ -303,14 +490,14 @@ def main():
 
         # Create entry
         entry_dir = generator.create_entry(original_path, edited_path, metadata)
-        print(f"Entry created: {entry_dir}")
+        log.info(f"Entry created: {entry_dir}")
 
     elif command == 'build':
         force_full = '--full' in sys.argv
         generator.build_site(force_full=force_full)
 
     else:
-        print(f"Unknown command: {command}", file=sys.stderr)
+        log.error(f"Unknown command: {command}")
         sys.exit(1)
 
 
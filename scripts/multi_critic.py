@@ -6,30 +6,316 @@ Submits photographs to multiple LLMs for objective, diverse critiques.
 
 import os
 import json
+import re
+import atexit
 import sys
 import base64
+import difflib
+import logging
+import functools
+import importlib
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from abc import ABC, abstractmethod
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from PIL import Image
 import io
 
-from utils import retry_with_backoff
+from utils import retry_with_backoff, AdaptiveLimiter, json_loads, setup_queue_logging
+from critique_cache import CritiqueCache, hash_image
 
 
-class BaseCritic(ABC):
-    """Abstract base class for LLM critics."""
+log = logging.getLogger('refract.multi_critic')
 
-    name: str = "base"
 
-    @abstractmethod
-    def analyze(self, image_path: Path) -> Dict[str, Any]:
-        """Analyze a photograph and return structured critique."""
+# Bump whenever _get_prompt changes so stale cached critiques invalidate
+PROMPT_VERSION = 1
+
+
+# Per-provider concurrency caps, sized from typical free-tier RPM budgets.
+# The AdaptiveLimiter halves the cap on 429s and recovers slowly.
+_PROVIDER_LIMITS = {
+    'gemini': 10,
+    'openai': 20,
+    'anthropic': 5,
+}
+
+# Base URLs for the critics that ride the shared httpx pool, used to warm
+# their TLS sessions at startup (Gemini's SDK owns its own transport)
+_PROVIDER_BASE_URLS = {
+    'openai': 'https://api.openai.com',
+    'anthropic': 'https://api.anthropic.com',
+}
+
+
+# Payloads pre-encoded by the process pool, consumed by _encode_image on
+# first lookup and then held in its LRU cache.
+_PRIMED_PAYLOADS: Dict[Tuple[str, float], Tuple[str, str]] = {}
+
+
+# Suffix -> media type for provider uploads; anything else falls back
+# to JPEG as before
+_MEDIA_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_media_type(suffix: str) -> str:
+    """Resolve a lowercased suffix to its media type (memoized)."""
+    return _MEDIA_TYPES.get(suffix, 'image/jpeg')
+
+
+def _media_type_for(image_path: Path) -> str:
+    """Get the media type for an image file."""
+    return _resolve_media_type(image_path.suffix.lower())
+
+
+def _payload_key(image_path: Path) -> Tuple[str, float]:
+    """Cache key for an image payload (path + mtime for invalidation)."""
+    return (str(image_path), image_path.stat().st_mtime)
+
+
+# Outermost JSON object in a model response, however it is fenced
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+# Required critique fields, validated with one set difference
+_REQUIRED_KEYS = frozenset({'score', 'improvements', 'notes'})
+
+# Type schema for the required critique fields, checked in one pass
+_CRITIQUE_SCHEMA = (
+    ('score', (int, float), "Score must be a number"),
+    ('improvements', list, "Improvements must be a list"),
+    ('notes', str, "Notes must be a string"),
+)
+
+
+# Severity prefix added by the structured-improvements format, ignored when
+# comparing improvements for similarity
+_IMPROVEMENT_TAG_RE = re.compile(
+    r"^\s*\[(subtle|moderate|significant|strong|major|minor|severe|light|heavy)\]\s*",
+    re.IGNORECASE
+)
+
+# Similarity threshold above which two improvements count as paraphrases
+_DEDUPE_THRESHOLD = 0.85
+
+
+def _dedupe_improvements(improvements: List[str]) -> List[str]:
+    """
+    Collapse duplicate and near-duplicate improvements across critics.
+
+    Different LLMs phrase the same edit differently ("increase brightness
+    by 20%" vs "brighten the image ~20%"), so exact string matching lets
+    paraphrases through to the editor. Compare severity-stripped,
+    lowercased text with difflib and keep the shortest phrasing from each
+    cluster, preserving first-seen order.
+    """
+    unique: List[str] = []
+    normalized: List[str] = []
+
+    for imp in improvements:
+        if not isinstance(imp, str) or not imp.strip():
+            continue
+        norm = _IMPROVEMENT_TAG_RE.sub('', imp).strip().lower()
+
+        for i, seen in enumerate(normalized):
+            if norm == seen or difflib.SequenceMatcher(None, norm, seen).ratio() >= _DEDUPE_THRESHOLD:
+                # Same edit, different phrasing - keep the shorter one
+                if len(imp) < len(unique[i]):
+                    unique[i] = imp
+                break
+        else:
+            unique.append(imp)
+            normalized.append(norm)
+
+    return unique
+
+
+# Long-edge limit for uploads - vision models resize internally to roughly
+# this scale, so larger originals just waste upload time and input tokens
+_MAX_UPLOAD_EDGE = 2048
+
+
+def build_payload(image_path: Path, size: Optional[Tuple[int, int]] = None) -> Tuple[str, str]:
+    """
+    Read, downscale if oversized, and base64-encode an image for upload.
+
+    Camera originals (10-40 MP) get resized to a 2048px long edge and
+    recompressed as JPEG q85 before encoding; already-small images pass
+    through untouched. This is the CPU-bound half of a critique request,
+    kept as a module-level function so it can be shipped to a
+    ProcessPoolExecutor.
+
+    Args:
+        image_path: Image to encode
+        size: Optional (width, height) measured earlier (e.g. during
+            validation), letting small non-HEIC images skip the decode
+
+    Returns:
+        Tuple of (base64_data, media_type)
+    """
+    if (size is not None
+            and image_path.suffix.lower() not in ('.heic', '.heif')
+            and size[0] * size[1] <= _MAX_UPLOAD_EDGE * _MAX_UPLOAD_EDGE):
+        return _encode_file_chunked(image_path), _media_type_for(image_path)
+
+    try:
+        with Image.open(image_path) as img:
+            oversized = img.width * img.height > _MAX_UPLOAD_EDGE * _MAX_UPLOAD_EDGE
+            # HEIC/HEIF must always be transcoded - the providers don't
+            # accept it as an inline image format
+            heic = image_path.suffix.lower() in ('.heic', '.heif')
+            if oversized or heic:
+                if oversized:
+                    # For JPEGs, draft() makes libjpeg decode at 1/2, 1/4,
+                    # or 1/8 scale inside the IDCT - a near-free head start
+                    # on the downscale (no-op for other formats)
+                    img.draft('RGB', (_MAX_UPLOAD_EDGE, _MAX_UPLOAD_EDGE))
+                    img.thumbnail((_MAX_UPLOAD_EDGE, _MAX_UPLOAD_EDGE), Image.Resampling.LANCZOS)
+                buf = io.BytesIO()
+                img.convert("RGB").save(buf, "JPEG", quality=85, optimize=True)
+                data = base64.standard_b64encode(buf.getvalue()).decode("utf-8")
+                return data, "image/jpeg"
+    except Exception:
+        # Unreadable via PIL - fall through and upload the raw bytes
         pass
 
-    def _get_prompt(self) -> str:
-        """Standard prompt for all LLMs."""
-        return """You are a professional photography editor with expertise in post-processing. Analyze this photograph to identify improvements that can be made through editing software (like Lightroom or Photoshop).
+    return _encode_file_chunked(image_path), _media_type_for(image_path)
+
+
+# Chunk size for streaming base64 encode - a multiple of 3 so no padding
+# straddles chunk boundaries
+_ENCODE_CHUNK = 48 * 1024
+
+
+def _encode_file_chunked(image_path: Path) -> str:
+    """
+    Base64-encode a file in chunks.
+
+    Encoding `f.read()` in one shot holds the raw bytes, the base64 bytes,
+    and the decoded str simultaneously (~4x file size); streaming through a
+    bytearray keeps peak memory near the encoded size alone.
+    """
+    encoded = bytearray()
+    with open(image_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_ENCODE_CHUNK), b''):
+            encoded += base64.standard_b64encode(chunk)
+    return encoded.decode("ascii")
+
+
+def prime_payload_cache(image_paths: List[Path],
+                        sizes: Optional[List[Optional[Tuple[int, int]]]] = None,
+                        chunksize: int = 8) -> None:
+    """
+    Pre-encode a batch of images in parallel processes.
+
+    Encoding is CPU-bound (libjpeg/PIL) while the LLM calls are I/O-bound, so
+    doing it up front in a process pool lets the network stage start with all
+    payloads ready. The chunksize amortizes the IPC cost of shipping encoded
+    payloads back across the process boundary.
+
+    Args:
+        image_paths: Images to pre-encode
+        sizes: Optional per-image (width, height) hints from validation
+        chunksize: Batch size for process-pool dispatch
+    """
+    if not image_paths:
+        return
+
+    if sizes is None:
+        sizes = [None] * len(image_paths)
+
+    try:
+        with ProcessPoolExecutor() as pool:
+            payloads = list(pool.map(build_payload, image_paths, sizes, chunksize=chunksize))
+    except Exception as e:
+        # Fall back silently to inline encoding in the critics
+        log.info(f"  Warning: payload preprocessing failed ({e}), encoding inline")
+        return
+
+    for image_path, payload in zip(image_paths, payloads):
+        _PRIMED_PAYLOADS[_payload_key(image_path)] = payload
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_image(path_str: str, mtime: float) -> Tuple[str, str]:
+    """
+    Get the (base64, media_type) payload for an image, encoding on miss.
+
+    Keyed on (path, mtime) so edits to a file invalidate the cached entry;
+    the LRU bound keeps memory in check on long runs.
+    """
+    primed = _PRIMED_PAYLOADS.pop((path_str, mtime), None)
+    if primed is not None:
+        return primed
+    return build_payload(Path(path_str))
+
+
+def _get_payload(image_path: Path) -> Tuple[str, str]:
+    """Get the cached payload for an image path."""
+    return _encode_image(*_payload_key(image_path))
+
+
+def _warm_sdk_imports(gemini: bool = False, openai: bool = False,
+                      anthropic: bool = False) -> None:
+    """
+    Import the configured provider SDKs concurrently.
+
+    Import failures are ignored here - the critic constructors report
+    them with their existing per-provider warnings.
+    """
+    modules = []
+    if gemini:
+        modules.append('google.genai')
+    if openai:
+        modules.append('openai')
+    if anthropic:
+        modules.append('anthropic')
+    if len(modules) < 2:
+        return
+
+    def _import(name):
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+    with ThreadPoolExecutor(max_workers=len(modules)) as pool:
+        for _ in pool.map(_import, modules):
+            pass
+
+
+def _build_shared_http_client():
+    """
+    Build one httpx.Client for the OpenAI and Anthropic SDKs to share.
+
+    Both SDKs sit on httpx, so a shared pool reuses keep-alive connections
+    across critics and retries. Returns None when httpx is unavailable,
+    letting each SDK fall back to its own default client.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+
+    client = httpx.Client(
+        timeout=httpx.Timeout(120.0, connect=10.0),
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    )
+    atexit.register(client.close)
+    return client
+
+
+# Shared critique prompt, built once at import time rather than per call
+_PROMPT = """You are a professional photography editor with expertise in post-processing. Analyze this photograph to identify improvements that can be made through editing software (like Lightroom or Photoshop).
 
 IMPORTANT: Your response must be ONLY valid JSON with no additional text, markdown, or code blocks.
 
@@ -89,43 +375,69 @@ ANALYSIS GUIDELINES:
 
 Output ONLY the JSON object."""
 
+
+class BaseCritic(ABC):
+    """Abstract base class for LLM critics."""
+
+    name: str = "base"
+
+    @property
+    def _limiter(self) -> AdaptiveLimiter:
+        """Lazily-created concurrency limiter for this provider."""
+        limiter = getattr(self, '_limiter_instance', None)
+        if limiter is None:
+            limiter = AdaptiveLimiter(_PROVIDER_LIMITS.get(self.name, 8))
+            self._limiter_instance = limiter
+        return limiter
+
+    @abstractmethod
+    def analyze(self, image_path: Path) -> Dict[str, Any]:
+        """Analyze a photograph and return structured critique."""
+        pass
+
+    def _get_prompt(self) -> str:
+        """Standard prompt for all LLMs."""
+        return _PROMPT
+
+
+
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """Parse and validate JSON response from any LLM."""
         response_text = response_text.strip()
 
-        # Remove markdown code blocks if present
-        if response_text.startswith('```'):
-            lines = response_text.split('\n')
-            response_text = '\n'.join(lines[1:-1])
-        if response_text.startswith('json'):
-            response_text = response_text[4:].strip()
+        # Extract the JSON object in one pass - handles markdown code
+        # fences and 'json' prefixes without the multi-pass string trims
+        match = _JSON_OBJECT_RE.search(response_text)
+        payload = match.group(0) if match else response_text
 
         # Parse JSON
-        critique = json.loads(response_text)
+        critique = json_loads(payload)
 
         # Validate required fields
-        required_keys = {'score', 'improvements', 'notes'}
-        if not required_keys.issubset(critique.keys()):
-            raise ValueError(f"Missing required keys. Expected {required_keys}, got {critique.keys()}")
+        missing_keys = _REQUIRED_KEYS - critique.keys()
+        if missing_keys:
+            raise ValueError(f"Missing required keys. Expected {set(_REQUIRED_KEYS)}, got {critique.keys()}")
 
-        # Validate types
-        if not isinstance(critique['score'], (int, float)):
+        # Validate types against the schema (bool passes the int check but
+        # isn't a meaningful score)
+        if isinstance(critique['score'], bool):
             raise ValueError("Score must be a number")
-        if not isinstance(critique['improvements'], list):
-            raise ValueError("Improvements must be a list")
-        if not isinstance(critique['notes'], str):
-            raise ValueError("Notes must be a string")
+        for key, expected_type, message in _CRITIQUE_SCHEMA:
+            if not isinstance(critique[key], expected_type):
+                raise ValueError(message)
 
         # Normalize score to 0-100
-        critique['score'] = max(0, min(100, float(critique['score'])))
+        critique['score'] = min(100.0, max(0.0, float(critique['score'])))
 
         # Handle new structured improvements format
         # Convert from [{action, intensity, priority, reason}] to string list for backward compatibility
         if critique['improvements'] and isinstance(critique['improvements'][0], dict):
-            # Sort by priority (lower number = higher priority)
+            # Sort by priority (lower number = higher priority); defaults
+            # are filled in one pass so the sort key is a C-level getter
             sorted_improvements = sorted(
-                critique['improvements'],
-                key=lambda x: x.get('priority', 5)
+                (imp if 'priority' in imp else {**imp, 'priority': 5}
+                 for imp in critique['improvements']),
+                key=itemgetter('priority')
             )
             # Store full structured data
             critique['improvements_detailed'] = sorted_improvements
@@ -147,22 +459,12 @@ Output ONLY the JSON object."""
         return critique
 
     def _image_to_base64(self, image_path: Path) -> str:
-        """Convert image to base64 string."""
-        with open(image_path, "rb") as f:
-            return base64.standard_b64encode(f.read()).decode("utf-8")
+        """Convert image to base64 string (reusing pre-encoded payloads)."""
+        return _get_payload(image_path)[0]
 
     def _get_image_media_type(self, image_path: Path) -> str:
         """Get the media type for an image."""
-        suffix = image_path.suffix.lower()
-        if suffix in ['.jpg', '.jpeg']:
-            return "image/jpeg"
-        elif suffix == '.png':
-            return "image/png"
-        elif suffix == '.gif':
-            return "image/gif"
-        elif suffix == '.webp':
-            return "image/webp"
-        return "image/jpeg"  # default
+        return _media_type_for(image_path)
 
 
 class GeminiCritic(BaseCritic):
@@ -172,16 +474,26 @@ class GeminiCritic(BaseCritic):
 
     def __init__(self, api_key: str):
         from google import genai
+        from google.genai import types
         self.client = genai.Client(api_key=api_key)
+        self._types = types
         self.model_name = 'gemini-3-pro-preview'
 
     @retry_with_backoff(max_retries=3, initial_delay=2.0)
     def analyze(self, image_path: Path) -> Dict[str, Any]:
-        img = Image.open(image_path)
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=[self._get_prompt(), img]
+        # Use the shared pre-encoded payload rather than a lazy PIL handle:
+        # the file is read once (not re-read by the SDK or on retry) and no
+        # file descriptor lingers until GC
+        base64_image, media_type = _get_payload(image_path)
+        image_part = self._types.Part.from_bytes(
+            data=base64.b64decode(base64_image),
+            mime_type=media_type
         )
+        with self._limiter:
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=[self._get_prompt(), image_part]
+            )
         return self._parse_response(response.text)
 
 
@@ -190,33 +502,33 @@ class OpenAICritic(BaseCritic):
 
     name = "openai"
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client=None):
         from openai import OpenAI
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=http_client)
 
     @retry_with_backoff(max_retries=3, initial_delay=2.0)
     def analyze(self, image_path: Path) -> Dict[str, Any]:
-        base64_image = self._image_to_base64(image_path)
-        media_type = self._get_image_media_type(image_path)
-
-        response = self.client.chat.completions.create(
-            model="gpt-5.2",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": self._get_prompt()},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:{media_type};base64,{base64_image}"
+        base64_image, media_type = _get_payload(image_path)
+
+        with self._limiter:
+            response = self.client.chat.completions.create(
+                model="gpt-5.2",
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "text", "text": self._get_prompt()},
+                            {
+                                "type": "image_url",
+                                "image_url": {
+                                    "url": f"data:{media_type};base64,{base64_image}"
+                                }
                             }
-                        }
-                    ]
-                }
-            ],
-            max_completion_tokens=1000
-        )
+                        ]
+                    }
+                ],
+                max_completion_tokens=1000
+            )
         return self._parse_response(response.choices[0].message.content)
 
 
@@ -225,38 +537,38 @@ class AnthropicCritic(BaseCritic):
 
     name = "anthropic"
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client=None):
         import anthropic
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = anthropic.Anthropic(api_key=api_key, http_client=http_client)
 
     @retry_with_backoff(max_retries=3, initial_delay=2.0)
     def analyze(self, image_path: Path) -> Dict[str, Any]:
-        base64_image = self._image_to_base64(image_path)
-        media_type = self._get_image_media_type(image_path)
-
-        response = self.client.messages.create(
-            model="claude-sonnet-4-5",
-            max_tokens=1000,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": base64_image
+        base64_image, media_type = _get_payload(image_path)
+
+        with self._limiter:
+            response = self.client.messages.create(
+                model="claude-sonnet-4-5",
+                max_tokens=1000,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "image",
+                                "source": {
+                                    "type": "base64",
+                                    "media_type": media_type,
+                                    "data": base64_image
+                                }
+                            },
+                            {
+                                "type": "text",
+                                "text": self._get_prompt()
                             }
-                        },
-                        {
-                            "type": "text",
-                            "text": self._get_prompt()
-                        }
-                    ]
-                }
-            ]
-        )
+                        ]
+                    }
+                ]
+            )
         return self._parse_response(response.content[0].text)
 
 
@@ -274,38 +586,59 @@ class MultiCritic:
         self,
         gemini_key: Optional[str] = None,
         openai_key: Optional[str] = None,
-        anthropic_key: Optional[str] = None
+        anthropic_key: Optional[str] = None,
+        cache_dir: Optional[Path] = None
     ):
         """
         Initialize MultiCritic with available API keys.
         At least one API key must be provided.
+
+        Args:
+            cache_dir: Optional directory for the persistent critique cache;
+                when set, unchanged images skip the API calls on re-runs
         """
         self.critics: List[BaseCritic] = []
+        self.cache = CritiqueCache(cache_dir) if cache_dir else None
+
+        # Import the heavy provider SDKs concurrently before building the
+        # critics - each pulls in grpc/httpx/pydantic machinery, so warming
+        # them in parallel cuts cold start to roughly the slowest import
+        _warm_sdk_imports(gemini=bool(gemini_key), openai=bool(openai_key),
+                          anthropic=bool(anthropic_key))
+
+        # One connection pool shared by the OpenAI and Anthropic SDKs (both
+        # are httpx-based), so keep-alive connections survive across calls
+        # instead of each SDK paying its own TLS handshakes
+        self._http_client = _build_shared_http_client()
 
         if gemini_key:
             try:
                 self.critics.append(GeminiCritic(gemini_key))
-                print(f"  Initialized Gemini critic")
+                log.info(f"  Initialized Gemini critic")
             except Exception as e:
-                print(f"  Warning: Failed to initialize Gemini critic: {e}")
+                log.info(f"  Warning: Failed to initialize Gemini critic: {e}")
 
         if openai_key:
             try:
-                self.critics.append(OpenAICritic(openai_key))
-                print(f"  Initialized OpenAI critic")
+                self.critics.append(OpenAICritic(openai_key, http_client=self._http_client))
+                log.info(f"  Initialized OpenAI critic")
             except Exception as e:
-                print(f"  Warning: Failed to initialize OpenAI critic: {e}")
+                log.info(f"  Warning: Failed to initialize OpenAI critic: {e}")
 
         if anthropic_key:
             try:
-                self.critics.append(AnthropicCritic(anthropic_key))
-                print(f"  Initialized Anthropic critic")
+                self.critics.append(AnthropicCritic(anthropic_key, http_client=self._http_client))
+                log.info(f"  Initialized Anthropic critic")
             except Exception as e:
-                print(f"  Warning: Failed to initialize Anthropic critic: {e}")
+                log.info(f"  Warning: Failed to initialize Anthropic critic: {e}")
 
         if not self.critics:
             raise ValueError("At least one API key must be provided and valid")
 
+        # Complete the TCP+TLS handshakes to the providers in the
+        # background so the first critique doesn't pay them
+        self._warm_connections()
+
     def analyze(self, image_path: Path) -> Dict[str, Any]:
         """
         Analyze a photograph using all configured LLM critics.
@@ -327,42 +660,54 @@ class MultiCritic:
         all_notes = []
         contexts = []
 
+        # Fan out to all critics concurrently - each call is dominated by
+        # network + LLM inference, so wall time collapses from sum to max
+        log.info(f"    Getting critiques from {', '.join(c.name for c in self.critics)}...")
+        image_hash = hash_image(image_path) if self.cache else None
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(self.critics)) as executor:
+            future_to_critic = {
+                executor.submit(self._analyze_one, critic, image_path, image_hash): critic
+                for critic in self.critics
+            }
+            for future in as_completed(future_to_critic):
+                critic = future_to_critic[future]
+                try:
+                    results[critic.name] = future.result()
+                except Exception as e:
+                    results[critic.name] = e
+
+        # Aggregate in configured critic order so output stays deterministic
         for critic in self.critics:
-            try:
-                print(f"    Getting critique from {critic.name}...")
-                result = critic.analyze(image_path)
-                result['llm'] = critic.name
-                critiques.append(result)
-                scores.append(result['score'])
-                all_improvements.extend(result['improvements'])
-                if 'improvements_detailed' in result:
-                    all_improvements_detailed.extend(result['improvements_detailed'])
-                if 'context' in result:
-                    contexts.append(result['context'])
-                all_notes.append(f"[{critic.name.upper()}] {result['notes']}")
-                print(f"      Score: {result['score']}/100")
-            except Exception as e:
-                print(f"    Warning: {critic.name} critique failed: {e}")
+            result = results[critic.name]
+            if isinstance(result, Exception):
+                log.info(f"    Warning: {critic.name} critique failed: {result}")
                 critiques.append({
                     'llm': critic.name,
-                    'error': str(e),
+                    'error': str(result),
                     'score': None,
                     'improvements': [],
-                    'notes': f"Analysis failed: {e}"
+                    'notes': f"Analysis failed: {result}"
                 })
+                continue
+
+            result['llm'] = critic.name
+            critiques.append(result)
+            scores.append(result['score'])
+            all_improvements.extend(result['improvements'])
+            if 'improvements_detailed' in result:
+                all_improvements_detailed.extend(result['improvements_detailed'])
+            if 'context' in result:
+                contexts.append(result['context'])
+            all_notes.append(f"[{critic.name.upper()}] {result['notes']}")
+            log.info(f"      {critic.name}: {result['score']}/100")
 
         # Calculate consensus
         valid_scores = [s for s in scores if s is not None]
         consensus_score = sum(valid_scores) / len(valid_scores) if valid_scores else 0
 
-        # Deduplicate improvements (simple approach - keep unique ones)
-        seen = set()
-        unique_improvements = []
-        for imp in all_improvements:
-            imp_lower = imp.lower().strip()
-            if imp_lower not in seen:
-                seen.add(imp_lower)
-                unique_improvements.append(imp)
+        # Deduplicate improvements, collapsing cross-critic paraphrases
+        unique_improvements = _dedupe_improvements(all_improvements)
 
         # Create summary
         summary = " | ".join(all_notes) if all_notes else "No critiques available"
@@ -383,6 +728,87 @@ class MultiCritic:
             'notes': summary
         }
 
+    def _warm_connections(self) -> None:
+        """Fire best-effort warm-up requests through the shared pool."""
+        if self._http_client is None:
+            return
+
+        urls = [
+            _PROVIDER_BASE_URLS[critic.name]
+            for critic in self.critics
+            if critic.name in _PROVIDER_BASE_URLS
+        ]
+
+        def _head(url):
+            try:
+                self._http_client.head(url, timeout=5.0)
+            except Exception:
+                pass  # Purely opportunistic - real calls will connect anyway
+
+        for url in urls:
+            threading.Thread(target=_head, args=(url,), daemon=True,
+                             name='connection-warmup').start()
+
+    def _analyze_one(self, critic: BaseCritic, image_path: Path,
+                     image_hash: Optional[str]) -> Dict[str, Any]:
+        """Run one critic, consulting the persistent cache when enabled."""
+        if self.cache and image_hash:
+            cached = self.cache.get(image_hash, critic.name, PROMPT_VERSION)
+            if cached is not None:
+                log.info(f"      {critic.name}: cache hit")
+                return cached
+
+        result = critic.analyze(image_path)
+
+        if self.cache and image_hash:
+            self.cache.put(image_hash, critic.name, PROMPT_VERSION, result)
+        return result
+
+    def analyze_batch(self, image_paths: List[Path]) -> Dict[Path, Dict[str, Any]]:
+        """
+        Analyze a batch of photographs, fanning out across images.
+
+        Each image still gets the full multi-critic treatment; the batch
+        layer overlaps the per-image round-trips so a large inbox run is
+        bounded by provider throughput rather than image count. Failures
+        are returned as error dicts rather than raised, so one bad image
+        doesn't sink the batch.
+
+        Returns:
+            Mapping of image path to its critique result
+        """
+        if not image_paths:
+            return {}
+
+        results: Dict[Path, Dict[str, Any]] = {}
+        max_workers = min(8, len(image_paths))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_path = {
+                executor.submit(self.analyze, path): path
+                for path in image_paths
+            }
+            for future in as_completed(future_to_path):
+                path = future_to_path[future]
+                try:
+                    results[path] = future.result()
+                except Exception as e:
+                    log.info(f"    Warning: batch critique failed for {path.name}: {e}")
+                    results[path] = {
+                        'error': str(e),
+                        'critiques': [],
+                        'consensus_score': 0,
+                        'combined_improvements': [],
+                        'improvements_detailed': [],
+                        'context': {},
+                        'summary': f"Analysis failed: {e}",
+                        'score': 0,
+                        'improvements': [],
+                        'notes': f"Analysis failed: {e}"
+                    }
+
+        return results
+
     def _merge_contexts(self, contexts: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Merge context information from multiple critics."""
         if not contexts:
@@ -425,14 +851,15 @@ class MultiCritic:
 
 def main():
     """CLI interface for the Multi-Critic."""
+    setup_queue_logging()
     if len(sys.argv) != 2:
-        print("Usage: multi_critic.py <image_path>", file=sys.stderr)
+        log.error("Usage: multi_critic.py <image_path>")
         sys.exit(1)
 
     image_path = Path(sys.argv[1])
 
     if not image_path.exists():
-        print(f"Error: Image not found: {image_path}", file=sys.stderr)
+        log.error(f"Error: Image not found: {image_path}")
         sys.exit(1)
 
     # Get API keys from environment
@@ -441,25 +868,25 @@ def main():
     anthropic_key = os.getenv('ANTHROPIC_API_KEY')
 
     if not any([gemini_key, openai_key, anthropic_key]):
-        print("Error: At least one API key must be set:", file=sys.stderr)
-        print("  GEMINI_API_KEY, OPENAI_API_KEY, or ANTHROPIC_API_KEY", file=sys.stderr)
+        log.error("Error: At least one API key must be set:")
+        log.error("  GEMINI_API_KEY, OPENAI_API_KEY, or ANTHROPIC_API_KEY")
         sys.exit(1)
 
-    print("Initializing critics...")
+    log.info("Initializing critics...")
     multi_critic = MultiCritic(
         gemini_key=gemini_key,
         openai_key=openai_key,
         anthropic_key=anthropic_key
     )
 
-    print(f"\nAnalyzing: {image_path.name}")
+    log.info(f"\nAnalyzing: {image_path.name}")
     result = multi_critic.analyze(image_path)
 
     # Output JSON
-    print("\n" + "="*60)
-    print("MULTI-LLM CRITIQUE RESULTS")
-    print("="*60)
-    print(json.dumps(result, indent=2))
+    log.info("\n" + "="*60)
+    log.info("MULTI-LLM CRITIQUE RESULTS")
+    log.info("="*60)
+    log.info(json.dumps(result, indent=2))
 
 
 if __name__ == '__main__':
@@ -7,6 +7,8 @@ Coordinates the Critic, Editor, and Generator to process photographs.
 import os
 import sys
 import json
+import shutil
+import logging
 import argparse
 from pathlib import Path
 from typing import List, Tuple
@@ -15,7 +17,9 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
 # Import our modules
-from multi_critic import MultiCritic
+from multi_critic import MultiCritic, prime_payload_cache
+from utils import setup_queue_logging
+from critique_cache import hash_image
 from editor import PhotoEditor
 from generator import SiteGenerator
 
@@ -28,7 +32,10 @@ except ImportError:
     HEIC_SUPPORT = False
 
 
-def validate_image(image_path: Path) -> Tuple[bool, str]:
+log = logging.getLogger('refract.pipeline')
+
+
+def validate_image(image_path: Path) -> Tuple[bool, str, dict]:
     """
     Validate that an image file is readable and valid.
 
@@ -36,19 +43,36 @@ def validate_image(image_path: Path) -> Tuple[bool, str]:
         image_path: Path to the image file
 
     Returns:
-        Tuple of (is_valid, error_message)
+        Tuple of (is_valid, error_message, metadata) where metadata holds
+        the size/mode/format measured during the validation decode, so
+        later stages don't need to reopen the file just for dimensions
     """
     from PIL import Image as PILImage
 
     try:
-        with PILImage.open(image_path) as img:
-            img.verify()
-        # Re-open to actually load (verify() makes the file unusable)
+        # A single load() raises on truncation/corruption for all supported
+        # codecs, so the separate verify() pass (which invalidates the
+        # handle and forces a re-open) is redundant
         with PILImage.open(image_path) as img:
             img.load()
-        return True, ""
+            meta = {'size': img.size, 'mode': img.mode, 'format': img.format}
+        return True, "", meta
     except Exception as e:
-        return False, str(e)
+        return False, str(e), {}
+
+
+def _stage_original(src: Path, dst: Path):
+    """
+    Stage the original image as the edited output without copying bytes.
+
+    Hardlinking is a metadata-only operation; fall back to a real copy on
+    filesystems (or cross-device layouts) that refuse the link. Only safe
+    for destinations that are read and moved, never rewritten in place.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
 
 
 class RefractPipeline:
@@ -56,6 +80,7 @@ class RefractPipeline:
 
     def __init__(self, repo_root: Path, dry_run: bool = False):
         """Initialize the pipeline."""
+        setup_queue_logging()
         self.repo_root = repo_root
         self.inbox_dir = repo_root / 'inbox'
         self.dry_run = dry_run
@@ -69,11 +94,12 @@ class RefractPipeline:
             raise ValueError("At least one API key must be set: GEMINI_API_KEY, OPENAI_API_KEY, or ANTHROPIC_API_KEY")
 
         # Initialize components
-        print("Initializing Multi-LLM Critics...")
+        log.info("Initializing Multi-LLM Critics...")
         self.critic = MultiCritic(
             gemini_key=self.gemini_key,
             openai_key=self.openai_key,
-            anthropic_key=self.anthropic_key
+            anthropic_key=self.anthropic_key,
+            cache_dir=repo_root / '.refract-cache'
         )
 
         # Editor still uses Gemini (requires GEMINI_API_KEY for image generation)
@@ -82,38 +108,52 @@ class RefractPipeline:
         else:
             self.editor = None
             if not self.dry_run:
-                print("  Warning: No GEMINI_API_KEY - image editing disabled")
+                log.info("  Warning: No GEMINI_API_KEY - image editing disabled")
 
         if not self.dry_run:
             self.generator = SiteGenerator(repo_root)
         else:
             self.generator = None
 
-        # Thread safety lock for generator operations
-        self._lock = threading.Lock()
+        # Generator writes are confined to unique per-entry directories,
+        # so workers don't need to serialize around them
+
+        # Image metadata gathered during validation, keyed by path
+        self._image_meta = {}
+
+        # Entry directories created per image, for duplicate handling
+        self._entry_dirs = {}
+
+        # Content hashes computed during dedup, reused for checkpoints
+        self._image_hashes = {}
+
+        # Per-image checkpoints so a crashed run resumes instead of
+        # re-paying the critic calls
+        self.state_dir = repo_root / '.refract-state'
 
     def get_new_images(self) -> List[Path]:
         """Find all images in the inbox."""
         if not self.inbox_dir.exists():
             return []
 
-        # Supported image extensions (WebP and HEIC added)
-        image_extensions = {
-            '.jpg', '.jpeg', '.png', '.webp',
-            '.JPG', '.JPEG', '.PNG', '.WEBP'
-        }
-
-        # Add HEIC extensions if support is available
+        # Supported image extensions, matched case-insensitively
+        # (WebP and HEIC added; HEIC only if support is available)
+        image_extensions = {'.jpg', '.jpeg', '.png', '.webp'}
         if HEIC_SUPPORT:
-            image_extensions.update({'.heic', '.heif', '.HEIC', '.HEIF'})
+            image_extensions.update({'.heic', '.heif'})
 
         images = []
 
-        for file_path in self.inbox_dir.iterdir():
-            if file_path.is_file() and file_path.suffix in image_extensions:
+        # os.scandir avoids the extra stat per entry that iterdir incurs
+        with os.scandir(self.inbox_dir) as entries:
+            for entry in entries:
+                name = entry.name
                 # Skip hidden files and .gitkeep
-                if not file_path.name.startswith('.'):
-                    images.append(file_path)
+                if name.startswith('.') or not entry.is_file(follow_symlinks=False):
+                    continue
+                dot = name.rfind('.')
+                if dot >= 0 and name[dot:].lower() in image_extensions:
+                    images.append(Path(entry.path))
 
         return sorted(images)
 
@@ -127,58 +167,108 @@ class RefractPipeline:
         Returns:
             Tuple of (valid_images, invalid_images_with_errors)
         """
+        if not images:
+            return [], []
+
         valid = []
         invalid = []
 
-        for image_path in images:
-            is_valid, error = validate_image(image_path)
+        # Decode work releases the GIL inside PIL, so threads overlap the
+        # disk reads and codec work across cores; map preserves order
+        max_workers = min(os.cpu_count() or 1, len(images))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(validate_image, images)
+
+        for image_path, (is_valid, error, meta) in zip(images, results):
             if is_valid:
                 valid.append(image_path)
+                self._image_meta[image_path] = meta
             else:
                 invalid.append((image_path, error))
 
         return valid, invalid
 
-    def process_image(self, image_path: Path) -> bool:
+    def _state_path(self, image_hash: str) -> Path:
+        return self.state_dir / f"{image_hash}.json"
+
+    def _load_state(self, image_hash: str) -> dict:
+        """Load the checkpoint for an image, or an empty dict."""
+        try:
+            with open(self._state_path(image_hash)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, image_hash: str, key: str, payload) -> None:
+        """Atomically merge a completed step's result into the checkpoint."""
+        state = self._load_state(image_hash)
+        state[key] = payload
+        self.state_dir.mkdir(exist_ok=True)
+        tmp_path = self._state_path(image_hash).with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self._state_path(image_hash))
+
+    def _clear_state(self, image_hash: str) -> None:
+        self._state_path(image_hash).unlink(missing_ok=True)
+
+    def process_image(self, image_path: Path, critique: dict = None) -> bool:
         """
         Process a single image through the complete pipeline.
 
         Args:
             image_path: Path to the image in the inbox
+            critique: Optional pre-computed critique (from a batch analysis);
+                when omitted the critics are invoked here
 
         Returns:
             True if successful, False otherwise
         """
-        print(f"\n{'='*60}")
-        print(f"Processing: {image_path.name}")
-        print(f"{'='*60}\n")
+        log.info(f"\n{'='*60}")
+        log.info(f"Processing: {image_path.name}")
+        log.info(f"{'='*60}\n")
 
         try:
             # STEP 1: CRITIC - Analyze the photograph with multiple LLMs
-            print("STEP 1: Analyzing photograph with multiple LLMs...")
-            critique = self.critic.analyze(image_path)
+            log.info("STEP 1: Analyzing photograph with multiple LLMs...")
+            # A pre-computed batch critique that failed must fail the image
+            # here too, matching the non-batch path: the original stays in
+            # the inbox for a retry instead of becoming a junk entry
+            if critique is not None and 'error' in critique:
+                log.error(f"Batch analysis failed for {image_path.name}: {critique['error']}")
+                return False
+            image_hash = self._image_hashes.get(image_path)
+            if critique is None and image_hash and not self.dry_run:
+                checkpoint = self._load_state(image_hash)
+                if 'critique' in checkpoint:
+                    log.info("  Resuming from checkpoint (critique already done)")
+                    critique = checkpoint['critique']
+            if critique is None:
+                critique = self.critic.analyze(image_path)
+                if image_hash and not self.dry_run:
+                    self._save_state(image_hash, 'critique', critique)
 
             # Display individual LLM scores
-            print("\n  Individual LLM Scores:")
+            log.info("\n  Individual LLM Scores:")
             for c in critique.get('critiques', []):
                 if c.get('score') is not None:
-                    print(f"    {c['llm'].upper()}: {c['score']}/100")
+                    log.info(f"    {c['llm'].upper()}: {c['score']}/100")
                 else:
-                    print(f"    {c['llm'].upper()}: Failed - {c.get('error', 'Unknown error')}")
+                    log.info(f"    {c['llm'].upper()}: Failed - {c.get('error', 'Unknown error')}")
 
-            print(f"\n  Consensus Score: {critique['consensus_score']}/100")
-            print(f"  Combined Improvements: {len(critique['combined_improvements'])}")
+            log.info(f"\n  Consensus Score: {critique['consensus_score']}/100")
+            log.info(f"  Combined Improvements: {len(critique['combined_improvements'])}")
             for i, improvement in enumerate(critique['improvements'], 1):
-                print(f"    {i}. {improvement}")
-            print()
+                log.info(f"    {i}. {improvement}")
+            log.info("")
 
             # If dry run, stop here
             if self.dry_run:
-                print("  [DRY RUN] Skipping edit, archive, and site generation")
+                log.info("  [DRY RUN] Skipping edit, archive, and site generation")
                 return True
 
             # STEP 2: EDITOR - Apply improvements
-            print("STEP 2: Applying improvements...")
+            log.info("STEP 2: Applying improvements...")
 
             # Create temporary edited image
             edited_path = image_path.parent / f"edited_{image_path.name}"
@@ -189,146 +279,208 @@ class RefractPipeline:
                 success = self.editor.edit(image_path, critique['improvements'], edited_path, context)
 
                 if not success:
-                    print("  Warning: Failed to edit image, using original")
-                    # Copy original as edited for fallback
-                    import shutil
-                    shutil.copy(image_path, edited_path)
+                    log.info("  Warning: Failed to edit image, using original")
+                    # Stage original as edited for fallback
+                    _stage_original(image_path, edited_path)
                 else:
-                    print(f"  Image edited successfully\n")
+                    log.info(f"  Image edited successfully\n")
             else:
                 # No editor available, use original image
-                print("  Skipping edits (no GEMINI_API_KEY for editor)")
-                import shutil
-                shutil.copy(image_path, edited_path)
+                log.info("  Skipping edits (no GEMINI_API_KEY for editor)")
+                _stage_original(image_path, edited_path)
 
             # Validate the edited image is a valid image file
             from PIL import Image as PILImage
             try:
-                with PILImage.open(edited_path) as test_img:
-                    test_img.verify()
-                # Re-open to actually load and ensure it's readable
                 with PILImage.open(edited_path) as test_img:
                     test_img.load()
             except Exception as validate_err:
-                print(f"  Warning: Edited image validation failed ({validate_err}), using original")
-                import shutil
-                shutil.copy(image_path, edited_path)
-                # Convert to ensure proper format
-                with PILImage.open(edited_path) as img:
-                    if edited_path.suffix.lower() in ['.jpg', '.jpeg']:
+                log.info(f"  Warning: Edited image validation failed ({validate_err}), using original")
+                # Re-encode the original straight over the broken edited
+                # file: one decode, no intermediate copy
+                with PILImage.open(image_path) as img:
+                    if edited_path.suffix.lower() in ['.jpg', '.jpeg'] and img.mode != 'RGB':
                         img = img.convert('RGB')
                     img.save(edited_path, quality=95)
 
-            # STEP 3: RE-REVIEW - Score the edited photograph
-            print("STEP 3: Re-reviewing edited photograph...")
-            try:
-                re_review = self.critic.analyze(edited_path)
+            # STEP 3: RE-REVIEW - Score the edited photograph in the
+            # background while the generator writes the entry to disk
+            log.info("STEP 3: Re-reviewing edited photograph...")
+            with ThreadPoolExecutor(max_workers=1) as re_review_executor:
+                re_review_future = re_review_executor.submit(self.critic.analyze, edited_path)
+
+                # STEP 4: GENERATOR - Create entry and update site.
+                # The edited temp file is hardlinked (not moved) into the
+                # entry so the in-flight re-review can keep reading it.
+                log.info("STEP 4: Creating documentation...")
+                entry_dir = self.generator.create_entry(
+                    image_path, edited_path, critique, link_edited=True
+                )
+                self._entry_dirs[image_path] = entry_dir
+                log.info(f"  Entry created: {entry_dir.name}\n")
 
-                # Display re-review scores
-                print("\n  Re-review Scores:")
-                for c in re_review.get('critiques', []):
-                    if c.get('score') is not None:
-                        print(f"    {c['llm'].upper()}: {c['score']}/100")
-                    else:
-                        print(f"    {c['llm'].upper()}: Failed - {c.get('error', 'Unknown error')}")
-
-                original_score = critique['consensus_score']
-                new_score = re_review['consensus_score']
-                delta = round(new_score - original_score, 1)
-                sign = "+" if delta > 0 else ""
-                print(f"\n  Original Score: {original_score}/100")
-                print(f"  Re-review Score: {new_score}/100")
-                print(f"  Improvement: {sign}{delta} points\n")
-
-                critique['re_review'] = {
-                    'critiques': re_review.get('critiques', []),
-                    'consensus_score': re_review['consensus_score'],
-                    'score': re_review['score'],
-                    'notes': re_review.get('notes', ''),
-                    'summary': re_review.get('summary', ''),
-                    'context': re_review.get('context', {}),
-                    'score_delta': delta,
-                }
-            except Exception as e:
-                print(f"  Warning: Re-review failed: {e}")
-                print("  Continuing without re-review data.\n")
-
-            # STEP 4: GENERATOR - Create entry and update site
-            print("STEP 4: Creating documentation...")
-
-            # Thread-safe entry creation
-            with self._lock:
-                entry_dir = self.generator.create_entry(image_path, edited_path, critique)
-                print(f"  Entry created: {entry_dir.name}\n")
-
-            # Clean up temporary edited image
+                try:
+                    re_review = re_review_future.result()
+
+                    # Display re-review scores
+                    log.info("\n  Re-review Scores:")
+                    for c in re_review.get('critiques', []):
+                        if c.get('score') is not None:
+                            log.info(f"    {c['llm'].upper()}: {c['score']}/100")
+                        else:
+                            log.info(f"    {c['llm'].upper()}: Failed - {c.get('error', 'Unknown error')}")
+
+                    original_score = critique['consensus_score']
+                    new_score = re_review['consensus_score']
+                    delta = round(new_score - original_score, 1)
+                    sign = "+" if delta > 0 else ""
+                    log.info(f"\n  Original Score: {original_score}/100")
+                    log.info(f"  Re-review Score: {new_score}/100")
+                    log.info(f"  Improvement: {sign}{delta} points\n")
+
+                    re_review_data = {
+                        'critiques': re_review.get('critiques', []),
+                        'consensus_score': re_review['consensus_score'],
+                        'score': re_review['score'],
+                        'notes': re_review.get('notes', ''),
+                        'summary': re_review.get('summary', ''),
+                        'context': re_review.get('context', {}),
+                        'score_delta': delta,
+                    }
+                    critique['re_review'] = re_review_data
+
+                    # The entry was written before the re-review finished;
+                    # patch its metadata with the late-arriving data
+                    self.generator.update_entry(entry_dir, {'re_review': re_review_data})
+                except Exception as e:
+                    log.info(f"  Warning: Re-review failed: {e}")
+                    log.info("  Continuing without re-review data.\n")
+
+            # Clean up the temporary edited image (its hardlink lives on
+            # inside the entry directory)
             if edited_path.exists():
                 edited_path.unlink()
 
             # Archive the original from inbox
-            print("STEP 5: Archiving original...")
+            log.info("STEP 5: Archiving original...")
             image_path.unlink()
-            print(f"  Removed from inbox: {image_path.name}\n")
+            log.info(f"  Removed from inbox: {image_path.name}\n")
+
+            # The image made it all the way through; drop its checkpoint
+            if image_hash:
+                self._clear_state(image_hash)
 
-            print(f"Successfully processed: {image_path.name}")
+            log.info(f"Successfully processed: {image_path.name}")
             return True
 
         except Exception as e:
-            print(f"Error processing {image_path.name}: {e}", file=sys.stderr)
-            traceback.print_exc()
+            log.error(f"Error processing {image_path.name}: {e}")
+            log.error(traceback.format_exc())
             return False
 
     def run(self):
         """Run the complete pipeline."""
-        print("\n" + "="*60)
-        print("REFRACT - Automated Photography Improvement Pipeline")
+        log.info("\n" + "="*60)
+        log.info("REFRACT - Automated Photography Improvement Pipeline")
         if self.dry_run:
-            print("          *** DRY RUN MODE ***")
-        print("="*60 + "\n")
+            log.info("          *** DRY RUN MODE ***")
+        log.info("="*60 + "\n")
 
         if not HEIC_SUPPORT:
-            print("Note: HEIC/HEIF support not available (install pillow-heif)\n")
+            log.info("Note: HEIC/HEIF support not available (install pillow-heif)\n")
 
         # Find new images
         images = self.get_new_images()
 
         if not images:
-            print("No new images found in inbox/")
-            print("Add photos to inbox/ and push to trigger processing.\n")
+            log.info("No new images found in inbox/")
+            log.info("Add photos to inbox/ and push to trigger processing.\n")
             return
 
-        print(f"Found {len(images)} image(s) to process:\n")
+        log.info(f"Found {len(images)} image(s) to process:\n")
         for img in images:
-            print(f"  - {img.name}")
-        print()
+            log.info(f"  - {img.name}")
+        log.info("")
 
         # Validate images upfront
-        print("Validating images...")
+        log.info("Validating images...")
         valid_images, invalid_images = self.validate_images(images)
 
         if invalid_images:
-            print(f"\nWarning: {len(invalid_images)} invalid image(s) found:")
+            log.info(f"\nWarning: {len(invalid_images)} invalid image(s) found:")
             for img_path, error in invalid_images:
-                print(f"  - {img_path.name}: {error}")
-            print()
+                log.info(f"  - {img_path.name}: {error}")
+            log.info("")
 
         if not valid_images:
-            print("No valid images to process.\n")
+            log.info("No valid images to process.\n")
             return
 
-        print(f"Processing {len(valid_images)} valid image(s)...\n")
-
-        # Process images in parallel (max 3 concurrent to avoid API rate limits)
+        # Collapse byte-identical images (burst duplicates, re-drops):
+        # critique the first of each group and clone its entry for the rest
+        hash_groups = {}
+        for img in valid_images:
+            try:
+                img_hash = hash_image(img)
+            except OSError:
+                hash_groups[img] = [img]
+                continue
+            self._image_hashes[img] = img_hash
+            hash_groups.setdefault(img_hash, []).append(img)
+
+        duplicates = {}
+        unique_images = []
+        for group in hash_groups.values():
+            unique_images.append(group[0])
+            if len(group) > 1:
+                duplicates[group[0]] = group[1:]
+                for dup in group[1:]:
+                    log.info(f"  Duplicate of {group[0].name}: {dup.name}")
+
+        valid_images = unique_images
+
+        log.info(f"Processing {len(valid_images)} valid image(s)...\n")
+
+        # Pre-encode payloads in parallel processes (CPU-bound) in the
+        # background, so encoding of later images overlaps the first
+        # images' network-bound critique calls instead of delaying them
+        if len(valid_images) > 1:
+            sizes = [self._image_meta.get(img, {}).get('size') for img in valid_images]
+            prefetcher = threading.Thread(
+                target=prime_payload_cache,
+                args=(valid_images, sizes),
+                name='payload-prefetch',
+                daemon=True
+            )
+            prefetcher.start()
+
+        # Process images in parallel (bounded to avoid API rate limits;
+        # override with REFRACT_CONCURRENCY)
         successful = 0
         failed = 0
-        max_workers = min(3, len(valid_images))  # Don't create more workers than images
+        try:
+            concurrency = int(os.getenv('REFRACT_CONCURRENCY', '3'))
+        except ValueError:
+            concurrency = 3
+        max_workers = max(1, min(concurrency, len(valid_images)))  # Don't create more workers than images
 
-        print(f"Processing with {max_workers} parallel worker(s)...\n")
+        log.info(f"Processing with {max_workers} parallel worker(s)...\n")
+
+        # For large inbox runs, analyze everything up front as a batch so
+        # critique throughput isn't capped by the per-image worker count
+        batch_critiques = {}
+        try:
+            batch_threshold = int(os.getenv('REFRACT_BATCH_THRESHOLD', '20'))
+        except ValueError:
+            batch_threshold = 20
+        if len(valid_images) >= batch_threshold:
+            log.info(f"Batch mode: analyzing {len(valid_images)} images up front...\n")
+            batch_critiques = self.critic.analyze_batch(valid_images)
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all image processing tasks
             future_to_image = {
-                executor.submit(self.process_image, img): img
+                executor.submit(self.process_image, img, batch_critiques.get(img)): img
                 for img in valid_images
             }
 
@@ -341,29 +493,45 @@ class RefractPipeline:
                     else:
                         failed += 1
                 except Exception as e:
-                    print(f"Exception processing {image_path.name}: {e}", file=sys.stderr)
-                    traceback.print_exc()
+                    log.error(f"Exception processing {image_path.name}: {e}")
+                    log.error(traceback.format_exc())
                     failed += 1
 
-        # Rebuild site (unless dry run)
-        if not self.dry_run:
-            print("\n" + "="*60)
-            print("Rebuilding static site...")
-            print("="*60 + "\n")
+        # Clone entries for duplicate inbox files and clear them
+        if duplicates and not self.dry_run:
+            for source, dups in duplicates.items():
+                entry_dir = self._entry_dirs.get(source)
+                if entry_dir is None:
+                    continue  # Source failed; leave its duplicates for a retry
+                for dup in dups:
+                    try:
+                        self.generator.duplicate_entry(entry_dir, dup)
+                        dup.unlink()
+                        successful += 1
+                    except Exception as e:
+                        log.error(f"Error duplicating entry for {dup.name}: {e}")
+                        failed += 1
+
+        # Rebuild site (unless dry run or nothing changed - the build is
+        # incremental, but a run with zero new entries can skip it outright)
+        if not self.dry_run and successful > 0:
+            log.info("\n" + "="*60)
+            log.info("Rebuilding static site...")
+            log.info("="*60 + "\n")
 
             self.generator.build_site()
 
         # Summary
-        print("\n" + "="*60)
-        print("Pipeline Summary")
-        print("="*60)
-        print(f"  Mode: {'DRY RUN' if self.dry_run else 'FULL'}")
-        print(f"  Processed: {successful} successful, {failed} failed")
+        log.info("\n" + "="*60)
+        log.info("Pipeline Summary")
+        log.info("="*60)
+        log.info(f"  Mode: {'DRY RUN' if self.dry_run else 'FULL'}")
+        log.info(f"  Processed: {successful} successful, {failed} failed")
         if invalid_images:
-            print(f"  Skipped: {len(invalid_images)} invalid")
+            log.info(f"  Skipped: {len(invalid_images)} invalid")
         if not self.dry_run and self.generator:
-            print(f"  Total entries: {len(self.generator.get_all_entries())}")
-        print("="*60 + "\n")
+            log.info(f"  Total entries: {len(self.generator.get_all_entries())}")
+        log.info("="*60 + "\n")
 
 
 def main():
@@ -384,8 +552,8 @@ def main():
         pipeline = RefractPipeline(repo_root, dry_run=args.dry_run)
         pipeline.run()
     except Exception as e:
-        print(f"Fatal error: {e}", file=sys.stderr)
-        traceback.print_exc()
+        log.error(f"Fatal error: {e}")
+        log.error(traceback.format_exc())
         sys.exit(1)
 
 
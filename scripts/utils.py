@@ -3,18 +3,241 @@
 REFRACT Utilities - Shared helper functions and decorators.
 """
 
+import sys
+import json
+import re
 import time
+import atexit
+import queue
+import random
+import logging
+import logging.handlers
+import threading
 from functools import wraps
 
 
-def retry_with_backoff(max_retries=3, initial_delay=2.0, backoff_factor=2.0):
+log = logging.getLogger('refract.utils')
+
+
+def setup_queue_logging():
+    """
+    Route all refract.* output through a single background logger thread.
+
+    Worker threads emit ~20 messages per image; direct stdout writes
+    contend on the stream lock and interleave mid-block. A QueueHandler
+    on the shared 'refract' parent makes emitting a message a lock-free
+    enqueue, and one QueueListener daemon thread owns all the actual
+    writes, keeping output ordered per enqueue. Idempotent so repeated
+    setup doesn't stack handlers.
+    """
+    root = logging.getLogger('refract')
+    if root.handlers:
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    root.propagate = False
+
+    listener.start()
+    atexit.register(listener.stop)
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """
+    Parse JSON with orjson when available, falling back to stdlib json.
+
+    Raises json.JSONDecodeError on invalid input regardless of backend.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            if not isinstance(data, str):
+                data = bytes(data).decode('utf-8', 'replace')
+            raise json.JSONDecodeError(str(e), data, 0) from None
+    if not isinstance(data, (str, bytes, bytearray)):
+        # stdlib json can't read buffer-protocol objects (e.g. mmap)
+        data = bytes(data)
+    return json.loads(data)
+
+
+def json_dump_bytes(data):
+    """
+    Serialize to indented UTF-8 JSON bytes, with orjson when available.
+
+    Returning bytes lets callers write in binary mode, skipping the
+    TextIOWrapper encode pass.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+# Local binding saves the time-module attribute lookup per retry sleep
+# and gives tests a stable patch point (utils._sleep)
+_sleep = time.sleep
+
+
+# Retryable exception types, collected from provider SDKs that are
+# already loaded. Only an imported SDK can raise its typed exceptions,
+# so probing sys.modules classifies exactly while keeping `import utils`
+# free of the heavyweight SDK import stacks (generator and the tests
+# never need them, and the critics import their own SDKs themselves).
+_retryable_exceptions = ()
+
+
+def _collect_retryable_exceptions():
+    retryable = []
+    for module_name in ('openai', 'anthropic'):
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        for class_name in ('RateLimitError', 'APITimeoutError',
+                           'InternalServerError', 'APIConnectionError'):
+            exc_type = getattr(module, class_name, None)
+            if isinstance(exc_type, type):
+                retryable.append(exc_type)
+    genai_errors = sys.modules.get('google.genai.errors')
+    if genai_errors is not None:
+        exc_type = getattr(genai_errors, 'ServerError', None)
+        if isinstance(exc_type, type):
+            retryable.append(exc_type)
+    return tuple(retryable)
+
+
+def _get_retryable_exceptions():
+    """Collect lazily, re-probing until at least one SDK has loaded."""
+    global _retryable_exceptions
+    if not _retryable_exceptions:
+        _retryable_exceptions = _collect_retryable_exceptions()
+    return _retryable_exceptions
+
+
+# Substrings that identify a rate-limit error from any provider
+_RATE_LIMIT_PATTERNS = ('rate limit', 'quota', 'too many requests', '429')
+
+# Transient-error phrases from any provider, compiled once so retry
+# classification is a single scan instead of nine substring searches
+_RETRYABLE_RE = re.compile(
+    r'rate limit|quota|too many requests|429|timeout'
+    r'|temporarily unavailable|service unavailable|503|500',
+    re.IGNORECASE
+)
+
+
+def is_rate_limit_error(exception: Exception) -> bool:
+    """Check whether an exception looks like a provider rate-limit error."""
+    error_msg = str(exception).lower()
+    return any(pattern in error_msg for pattern in _RATE_LIMIT_PATTERNS)
+
+
+class AdaptiveLimiter:
+    """
+    Bound concurrent API calls to a provider, adapting to rate limits.
+
+    Used as a context manager around each API call. On a rate-limit error
+    the limit is halved (AIMD-style); after a quiet recovery interval with
+    no rate limits, the limit creeps back up by one until it reaches the
+    configured maximum.
+    """
+
+    def __init__(self, limit: int, recovery_interval: float = 60.0):
+        """
+        Args:
+            limit: Maximum number of concurrent calls
+            recovery_interval: Seconds without a rate limit before the
+                current limit is incremented back toward the maximum
+        """
+        self.max_limit = max(1, limit)
+        self.limit = self.max_limit
+        self.recovery_interval = recovery_interval
+        self._active = 0
+        self._last_adjust = time.monotonic()
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        with self._cond:
+            self._maybe_recover()
+            while self._active >= self.limit:
+                self._cond.wait(timeout=1.0)
+                self._maybe_recover()
+            self._active += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._cond:
+            self._active -= 1
+            if exc_value is not None and is_rate_limit_error(exc_value):
+                self._shrink()
+            self._cond.notify()
+        return False  # Never swallow the exception
+
+    def _shrink(self):
+        """Halve the limit after a rate-limit error."""
+        self.limit = max(1, self.limit // 2)
+        self._last_adjust = time.monotonic()
+
+    def _maybe_recover(self):
+        """Slowly raise the limit again after a quiet period."""
+        now = time.monotonic()
+        if self.limit < self.max_limit and now - self._last_adjust >= self.recovery_interval:
+            self.limit += 1
+            self._last_adjust = now
+
+
+def _retry_after_seconds(exception):
+    """
+    Extract a Retry-After value (in seconds) from an API exception.
+
+    The provider SDKs attach the HTTP response to their exceptions;
+    returns None when no parseable header is present.
+    """
+    headers = getattr(getattr(exception, 'response', None), 'headers', None)
+    if headers is None:
+        return None
+
+    value = headers.get('retry-after')
+    if not value:
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    try:
+        from email.utils import parsedate_to_datetime
+        from datetime import datetime, timezone
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_with_backoff(max_retries=3, initial_delay=2.0, backoff_factor=2.0, max_delay=60.0):
     """
     Decorator to retry API calls with exponential backoff.
 
+    Delays are jittered by +/-25% so concurrent workers hitting the same
+    rate limit don't retry in lockstep, and a Retry-After header on the
+    exception's response takes precedence over the computed delay.
+
     Args:
         max_retries: Maximum number of retry attempts
         initial_delay: Initial delay in seconds before first retry
         backoff_factor: Multiplier for delay between retries
+        max_delay: Upper bound on any single sleep
     """
     def decorator(func):
         @wraps(func)
@@ -27,27 +250,36 @@ def retry_with_backoff(max_retries=3, initial_delay=2.0, backoff_factor=2.0):
                     return func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
-                    error_msg = str(e).lower()
-
-                    # Check if it's a rate limit or temporary error
-                    is_retryable = any([
-                        'rate limit' in error_msg,
-                        'quota' in error_msg,
-                        'too many requests' in error_msg,
-                        '429' in error_msg,
-                        'timeout' in error_msg,
-                        'temporarily unavailable' in error_msg,
-                        'service unavailable' in error_msg,
-                        '503' in error_msg,
-                        '500' in error_msg
-                    ])
+
+                    # Typed dispatch first: SDK exceptions classify exactly,
+                    # without the risk of a repr that happens to contain
+                    # "timeout" marking a programming error as retryable
+                    if isinstance(e, _get_retryable_exceptions()):
+                        is_retryable = True
+                    else:
+                        # Fall back to message sniffing for plain exceptions,
+                        # caching the verdict on the instance so re-raises of
+                        # the same exception skip the str() + scan
+                        is_retryable = getattr(e, '_refract_retryable', None)
+                        if is_retryable is None:
+                            is_retryable = bool(_RETRYABLE_RE.search(str(e)))
+                            try:
+                                e._refract_retryable = is_retryable
+                            except AttributeError:
+                                pass  # Exceptions with __slots__ can't be tagged
 
                     if not is_retryable or attempt == max_retries:
                         raise
 
-                    print(f"  API error (attempt {attempt + 1}/{max_retries}): {e}")
-                    print(f"  Retrying in {delay:.1f}s...")
-                    time.sleep(delay)
+                    retry_after = _retry_after_seconds(e)
+                    if retry_after is not None:
+                        sleep_for = min(retry_after, max_delay)
+                    else:
+                        sleep_for = min(delay, max_delay) * random.uniform(0.75, 1.25)
+
+                    log.info(f"  API error (attempt {attempt + 1}/{max_retries}): {e}")
+                    log.info(f"  Retrying in {sleep_for:.1f}s...")
+                    _sleep(sleep_for)
                     delay *= backoff_factor
 
             raise last_exception
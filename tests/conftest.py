@@ -0,0 +1,10 @@
+"""Shared pytest configuration for the REFRACT test suite."""
+
+import sys
+from pathlib import Path
+
+# Make the scripts/ modules importable from every test module without
+# each one mutating sys.path at import time
+_SCRIPTS_DIR = str(Path(__file__).parent.parent / 'scripts')
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
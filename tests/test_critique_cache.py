@@ -0,0 +1,89 @@
+"""Tests for critique_cache module."""
+
+import tempfile
+import shutil
+from pathlib import Path
+
+import pytest
+
+from critique_cache import CritiqueCache, hash_image
+
+
+@pytest.fixture
+def cache_dir():
+    """Create a temporary cache directory."""
+    temp_dir = Path(tempfile.mkdtemp())
+    yield temp_dir
+    shutil.rmtree(temp_dir)
+
+
+class TestHashImage:
+    """Tests for the content-hash helper."""
+
+    def test_same_content_same_hash(self, cache_dir):
+        """Identical file contents should hash the same despite names."""
+        file_a = cache_dir / 'a.jpg'
+        file_b = cache_dir / 'b.jpg'
+        file_a.write_bytes(b'image data')
+        file_b.write_bytes(b'image data')
+
+        assert hash_image(file_a) == hash_image(file_b)
+
+    def test_different_content_different_hash(self, cache_dir):
+        """Different contents should produce different hashes."""
+        file_a = cache_dir / 'a.jpg'
+        file_b = cache_dir / 'b.jpg'
+        file_a.write_bytes(b'image data')
+        file_b.write_bytes(b'other data')
+
+        assert hash_image(file_a) != hash_image(file_b)
+
+
+class TestCritiqueCache:
+    """Tests for the SQLite-backed critique cache."""
+
+    def test_miss_returns_none(self, cache_dir):
+        """Unknown keys should return None."""
+        cache = CritiqueCache(cache_dir)
+
+        assert cache.get('abc123', 'gemini', 1) is None
+
+    def test_roundtrip(self, cache_dir):
+        """Stored critiques should come back intact."""
+        cache = CritiqueCache(cache_dir)
+        critique = {'score': 85, 'improvements': ['Boost contrast'], 'notes': 'Good'}
+
+        cache.put('abc123', 'gemini', 1, critique)
+
+        assert cache.get('abc123', 'gemini', 1) == critique
+
+    def test_keyed_by_critic(self, cache_dir):
+        """Entries should be independent per critic."""
+        cache = CritiqueCache(cache_dir)
+        cache.put('abc123', 'gemini', 1, {'score': 85})
+
+        assert cache.get('abc123', 'openai', 1) is None
+
+    def test_keyed_by_prompt_version(self, cache_dir):
+        """A prompt version bump should invalidate old entries."""
+        cache = CritiqueCache(cache_dir)
+        cache.put('abc123', 'gemini', 1, {'score': 85})
+
+        assert cache.get('abc123', 'gemini', 2) is None
+
+    def test_persists_across_instances(self, cache_dir):
+        """The cache should survive reopening (new pipeline run)."""
+        cache = CritiqueCache(cache_dir)
+        cache.put('abc123', 'gemini', 1, {'score': 85})
+        cache.close()
+
+        reopened = CritiqueCache(cache_dir)
+        assert reopened.get('abc123', 'gemini', 1) == {'score': 85}
+
+    def test_put_replaces_existing(self, cache_dir):
+        """Re-storing a key should replace the previous critique."""
+        cache = CritiqueCache(cache_dir)
+        cache.put('abc123', 'gemini', 1, {'score': 70})
+        cache.put('abc123', 'gemini', 1, {'score': 90})
+
+        assert cache.get('abc123', 'gemini', 1) == {'score': 90}
@@ -1,77 +1,73 @@
 """Tests for generator module."""
 
-import sys
+import io
+import os
 import json
-import tempfile
 import shutil
 from pathlib import Path
 
 import pytest
 from PIL import Image
 
-# Add scripts to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
-
 from generator import SiteGenerator
 
 
+# Minimal templates shared by every test repository, kept as real files
+# so each test links them in instead of re-encoding string literals
+TEMPLATE_FIXTURES = Path(__file__).parent / 'fixtures' / 'templates'
+
+
 @pytest.fixture
-def temp_repo():
+def temp_repo(tmp_path):
     """Create a temporary repository structure for testing."""
-    temp_dir = Path(tempfile.mkdtemp())
-
-    # Create directory structure
-    (temp_dir / 'inbox').mkdir()
-    (temp_dir / 'processed').mkdir()
-    (temp_dir / 'site' / 'templates').mkdir(parents=True)
-    (temp_dir / 'site' / 'public').mkdir(parents=True)
-
-    # Create minimal templates
-    index_template = """<!DOCTYPE html>
-<html>
-<head><title>REFRACT</title></head>
-<body>
-<h1>Gallery</h1>
-{% for entry in entries %}
-<div>{{ entry.entry_id }}</div>
-{% endfor %}
-</body>
-</html>"""
-
-    entry_template = """<!DOCTYPE html>
-<html>
-<head><title>{{ entry.original_filename }}</title></head>
-<body>
-<h1>{{ entry.entry_id }}</h1>
-<p>Score: {{ entry.score }}</p>
-</body>
-</html>"""
-
-    (temp_dir / 'site' / 'templates' / 'index.html').write_text(index_template)
-    (temp_dir / 'site' / 'templates' / 'entry.html').write_text(entry_template)
-    (temp_dir / 'site' / 'templates' / 'style.css').write_text("/* test */")
-
-    yield temp_dir
-
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    # Create directory structure (tmp_path is cleaned up by pytest)
+    (tmp_path / 'inbox').mkdir()
+    (tmp_path / 'processed').mkdir()
+    target = tmp_path / 'site' / 'templates'
+    target.mkdir(parents=True)
+    (tmp_path / 'site' / 'public').mkdir()
+
+    # Hardlink the checked-in templates in (metadata-only; copy as a
+    # fallback for filesystems that refuse cross-device links)
+    for name in ('index.html', 'entry.html', 'style.css'):
+        try:
+            os.link(TEMPLATE_FIXTURES / name, target / name)
+        except OSError:
+            shutil.copyfile(TEMPLATE_FIXTURES / name, target / name)
+
+    return tmp_path
+
+
+def _solid_jpeg_bytes(color):
+    """Encode a solid-color 100x100 JPEG once."""
+    buf = io.BytesIO()
+    Image.new('RGB', (100, 100), color=color).save(buf, 'JPEG')
+    return buf.getvalue()
+
+
+@pytest.fixture(scope='session')
+def red_jpeg_bytes():
+    return _solid_jpeg_bytes('red')
+
+
+@pytest.fixture(scope='session')
+def blue_jpeg_bytes():
+    return _solid_jpeg_bytes('blue')
 
 
 @pytest.fixture
-def test_image(temp_repo):
+def test_image(temp_repo, red_jpeg_bytes):
     """Create a test image file."""
-    img = Image.new('RGB', (100, 100), color='red')
     img_path = temp_repo / 'test_original.jpg'
-    img.save(img_path)
+    img_path.write_bytes(red_jpeg_bytes)
     return img_path
 
 
 @pytest.fixture
-def edited_image(temp_repo):
+def edited_image(temp_repo, blue_jpeg_bytes):
     """Create an edited test image file."""
-    img = Image.new('RGB', (100, 100), color='blue')
     img_path = temp_repo / 'test_edited.jpg'
-    img.save(img_path)
+    img_path.write_bytes(blue_jpeg_bytes)
     return img_path
 
 
@@ -117,6 +113,20 @@ class TestSiteGenerator:
         assert 'entry_id' in saved_metadata
         assert saved_metadata['original_filename'] == test_image.name
 
+    def test_create_entry_move_edited(self, temp_repo, test_image, edited_image):
+        """move_edited should move the edited file instead of copying."""
+        generator = SiteGenerator(temp_repo)
+
+        metadata = {"score": 80, "improvements": [], "notes": ""}
+
+        entry_dir = generator.create_entry(test_image, edited_image, metadata,
+                                           move_edited=True)
+
+        assert (entry_dir / 'edited.jpg').exists()
+        assert not edited_image.exists()
+        # Original is still copied, not moved
+        assert test_image.exists()
+
     def test_create_entry_unique_ids(self, temp_repo, test_image, edited_image):
         """Each entry should have a unique ID."""
         generator = SiteGenerator(temp_repo)
@@ -128,6 +138,31 @@ class TestSiteGenerator:
 
         assert entry1.name != entry2.name
 
+    def test_duplicate_entry(self, temp_repo, test_image, edited_image):
+        """duplicate_entry should clone an entry with a new identity."""
+        generator = SiteGenerator(temp_repo)
+
+        metadata = {"score": 80, "improvements": ["Test"], "notes": "Notes"}
+        source_dir = generator.create_entry(test_image, edited_image, metadata)
+
+        dup_image = temp_repo / 'dup_original.jpg'
+        shutil.copy(test_image, dup_image)
+
+        dup_dir = generator.duplicate_entry(source_dir, dup_image)
+
+        assert dup_dir.exists()
+        assert dup_dir.name != source_dir.name
+        assert (dup_dir / 'original.jpg').exists()
+        assert (dup_dir / 'edited.jpg').exists()
+
+        with open(dup_dir / 'metadata.json') as f:
+            saved = json.load(f)
+
+        assert saved['score'] == 80
+        assert saved['original_filename'] == 'dup_original.jpg'
+        assert saved['duplicate_of'] == source_dir.name
+        assert saved['entry_id'] == dup_dir.name
+
     def test_get_all_entries_empty(self, temp_repo):
         """get_all_entries should return empty list when no entries."""
         generator = SiteGenerator(temp_repo)
@@ -350,6 +385,27 @@ class TestIncrementalBuilds:
         # Entry page should still be modified (not regenerated)
         assert entry_page.read_text() == "MODIFIED"
 
+    def test_incremental_build_rerenders_changed_metadata(self, temp_repo, test_image, edited_image):
+        """Entries whose metadata changed should be re-rendered."""
+        generator = SiteGenerator(temp_repo)
+
+        metadata = {"score": 80, "improvements": [], "notes": ""}
+        entry_dir = generator.create_entry(test_image, edited_image, metadata)
+
+        # First build
+        generator.build_site()
+
+        # Change the stored metadata and stamp the page
+        generator.update_entry(entry_dir, {"score": 95})
+        entry_page = temp_repo / 'site' / 'public' / f"{entry_dir.name}.html"
+        entry_page.write_text("MODIFIED")
+
+        # Second build (incremental) should re-render the changed entry
+        generator.build_site()
+
+        assert entry_page.read_text() != "MODIFIED"
+        assert "95" in entry_page.read_text()
+
     def test_full_build_regenerates_all(self, temp_repo, test_image, edited_image):
         """Full build should regenerate all entries."""
         generator = SiteGenerator(temp_repo)
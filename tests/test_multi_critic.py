@@ -1,15 +1,19 @@
 """Tests for multi_critic module."""
 
-import sys
 import json
 from pathlib import Path
 
 import pytest
 
-# Add scripts to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+from multi_critic import BaseCritic, _dedupe_improvements
 
-from multi_critic import BaseCritic
+
+# Canonical raw responses reused across tests - raw strings, since
+# serializing them per test just duplicates work the parser undoes
+VALID_RESPONSE = ('{"score": 85, "improvements": ["Increase brightness", '
+                  '"Boost contrast"], "notes": "Good composition overall."}')
+LEGACY_RESPONSE = ('{"score": 75, "improvements": ["Increase brightness", '
+                   '"Boost contrast"], "notes": "Good shot."}')
 
 
 class MockCritic(BaseCritic):
@@ -21,174 +25,74 @@ class MockCritic(BaseCritic):
         return {}
 
 
+@pytest.fixture(scope='class')
+def critic():
+    """One stateless MockCritic shared across a test class."""
+    return MockCritic()
+
+
 class TestBaseCriticParseResponse:
     """Tests for the _parse_response method."""
 
-    def setup_method(self):
-        """Create a mock critic for each test."""
-        self.critic = MockCritic()
-
-    def test_valid_json_response(self):
+    def test_valid_json_response(self, critic):
         """Valid JSON response should parse correctly."""
-        response = json.dumps({
-            "score": 85,
-            "improvements": ["Increase brightness", "Boost contrast"],
-            "notes": "Good composition overall."
-        })
-
-        result = self.critic._parse_response(response)
+        result = critic._parse_response(VALID_RESPONSE)
 
         assert result["score"] == 85
         assert len(result["improvements"]) == 2
         assert result["notes"] == "Good composition overall."
 
-    def test_json_with_markdown_code_block(self):
-        """JSON wrapped in markdown code blocks should be handled."""
-        response = """```json
-{
-  "score": 75,
-  "improvements": ["Test improvement"],
-  "notes": "Test notes"
-}
-```"""
-
-        result = self.critic._parse_response(response)
-
-        assert result["score"] == 75
-        assert result["improvements"] == ["Test improvement"]
-
-    def test_json_with_just_json_prefix(self):
-        """JSON with 'json' prefix should be handled."""
-        response = """json
-{
-  "score": 90,
-  "improvements": ["Test"],
-  "notes": "Notes"
-}"""
-
-        result = self.critic._parse_response(response)
-
-        assert result["score"] == 90
-
-    def test_score_normalization_above_100(self):
-        """Scores above 100 should be clamped to 100."""
-        response = json.dumps({
-            "score": 150,
-            "improvements": [],
-            "notes": ""
-        })
-
-        result = self.critic._parse_response(response)
-
-        assert result["score"] == 100
-
-    def test_score_normalization_below_0(self):
-        """Scores below 0 should be clamped to 0."""
-        response = json.dumps({
-            "score": -10,
-            "improvements": [],
-            "notes": ""
-        })
-
-        result = self.critic._parse_response(response)
-
-        assert result["score"] == 0
-
-    def test_score_as_float(self):
-        """Float scores should be accepted and normalized."""
-        response = json.dumps({
-            "score": 85.5,
-            "improvements": [],
-            "notes": ""
-        })
-
-        result = self.critic._parse_response(response)
-
-        assert result["score"] == 85.5
-
-    def test_missing_score_raises_error(self):
-        """Missing score field should raise ValueError."""
+    @pytest.mark.parametrize("response,expected_score", [
+        ('```json\n{"score": 75, "improvements": ["Test"], "notes": "Test notes"}\n```', 75),
+        ('json\n{"score": 90, "improvements": ["Test"], "notes": "Notes"}', 90),
+        ('\n\n  {"score": 70, "improvements": [], "notes": ""}\n\n', 70),
+    ], ids=["markdown_fence", "json_prefix", "whitespace"])
+    def test_wrapped_json_parses(self, critic, response, expected_score):
+        """Fenced, prefixed, and padded JSON should all be handled."""
+        result = critic._parse_response(response)
+
+        assert result["score"] == expected_score
+
+    @pytest.mark.parametrize("raw_score,expected", [
+        (150, 100),
+        (-10, 0),
+        (85.5, 85.5),
+    ], ids=["clamped_high", "clamped_low", "float_preserved"])
+    def test_score_normalization(self, critic, raw_score, expected):
+        """Scores should be clamped to 0-100, preserving floats."""
         response = json.dumps({
+            "score": raw_score,
             "improvements": [],
             "notes": ""
         })
 
-        with pytest.raises(ValueError, match="Missing required keys"):
-            self.critic._parse_response(response)
-
-    def test_missing_improvements_raises_error(self):
-        """Missing improvements field should raise ValueError."""
-        response = json.dumps({
-            "score": 80,
-            "notes": ""
-        })
-
-        with pytest.raises(ValueError, match="Missing required keys"):
-            self.critic._parse_response(response)
-
-    def test_missing_notes_raises_error(self):
-        """Missing notes field should raise ValueError."""
-        response = json.dumps({
-            "score": 80,
-            "improvements": []
-        })
-
-        with pytest.raises(ValueError, match="Missing required keys"):
-            self.critic._parse_response(response)
-
-    def test_invalid_score_type_raises_error(self):
-        """Non-numeric score should raise ValueError."""
-        response = json.dumps({
-            "score": "high",
-            "improvements": [],
-            "notes": ""
-        })
-
-        with pytest.raises(ValueError, match="Score must be a number"):
-            self.critic._parse_response(response)
-
-    def test_invalid_improvements_type_raises_error(self):
-        """Non-list improvements should raise ValueError."""
-        response = json.dumps({
-            "score": 80,
-            "improvements": "Single improvement",
-            "notes": ""
-        })
-
-        with pytest.raises(ValueError, match="Improvements must be a list"):
-            self.critic._parse_response(response)
-
-    def test_invalid_notes_type_raises_error(self):
-        """Non-string notes should raise ValueError."""
-        response = json.dumps({
-            "score": 80,
-            "improvements": [],
-            "notes": 123
-        })
-
-        with pytest.raises(ValueError, match="Notes must be a string"):
-            self.critic._parse_response(response)
-
-    def test_invalid_json_raises_error(self):
+        result = critic._parse_response(response)
+
+        assert result["score"] == expected
+
+    @pytest.mark.parametrize("payload,match", [
+        ({"improvements": [], "notes": ""}, "Missing required keys"),
+        ({"score": 80, "notes": ""}, "Missing required keys"),
+        ({"score": 80, "improvements": []}, "Missing required keys"),
+        ({"score": "high", "improvements": [], "notes": ""}, "Score must be a number"),
+        ({"score": True, "improvements": [], "notes": ""}, "Score must be a number"),
+        ({"score": 80, "improvements": "One", "notes": ""}, "Improvements must be a list"),
+        ({"score": 80, "improvements": [], "notes": 123}, "Notes must be a string"),
+    ], ids=["missing_score", "missing_improvements", "missing_notes",
+            "bad_score_type", "bool_score", "bad_improvements_type", "bad_notes_type"])
+    def test_invalid_response_raises(self, critic, payload, match):
+        """Missing or mistyped fields should raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            critic._parse_response(json.dumps(payload))
+
+    def test_invalid_json_raises_error(self, critic):
         """Invalid JSON should raise JSONDecodeError."""
         response = "not valid json {{"
 
         with pytest.raises(json.JSONDecodeError):
-            self.critic._parse_response(response)
-
-    def test_whitespace_handling(self):
-        """Whitespace around JSON should be trimmed."""
-        response = """
+            critic._parse_response(response)
 
-  {"score": 70, "improvements": [], "notes": ""}
-
-"""
-
-        result = self.critic._parse_response(response)
-
-        assert result["score"] == 70
-
-    def test_structured_improvements_format(self):
+    def test_structured_improvements_format(self, critic):
         """Structured improvements should be parsed and converted to string list."""
         response = json.dumps({
             "score": 78,
@@ -213,7 +117,7 @@ class TestBaseCriticParseResponse:
             "notes": "Strong composition with good light."
         })
 
-        result = self.critic._parse_response(response)
+        result = critic._parse_response(response)
 
         # Should have converted to string format with intensity prefix
         assert len(result["improvements"]) == 2
@@ -232,7 +136,7 @@ class TestBaseCriticParseResponse:
         assert result["context"]["subject"] == "Mountain lake at sunset"
         assert "reflection clarity" in result["context"]["preserve"]
 
-    def test_structured_improvements_sorted_by_priority(self):
+    def test_structured_improvements_sorted_by_priority(self, critic):
         """Structured improvements should be sorted by priority (lowest first)."""
         response = json.dumps({
             "score": 80,
@@ -244,13 +148,13 @@ class TestBaseCriticParseResponse:
             "notes": "Test"
         })
 
-        result = self.critic._parse_response(response)
+        result = critic._parse_response(response)
 
         assert "High priority" in result["improvements"][0]
         assert "Medium priority" in result["improvements"][1]
         assert "Low priority" in result["improvements"][2]
 
-    def test_context_populated_from_response(self):
+    def test_context_populated_from_response(self, critic):
         """Context should be populated from response fields."""
         response = json.dumps({
             "score": 85,
@@ -268,7 +172,7 @@ class TestBaseCriticParseResponse:
             "notes": "Nice portrait."
         })
 
-        result = self.critic._parse_response(response)
+        result = critic._parse_response(response)
 
         assert result["context"]["genre"] == "portrait"
         assert result["context"]["subject"] == "Woman in garden"
@@ -277,15 +181,9 @@ class TestBaseCriticParseResponse:
         assert result["context"]["technical"]["focus"] == "sharp"
         assert "skin tones" in result["context"]["preserve"]
 
-    def test_legacy_string_improvements_still_work(self):
+    def test_legacy_string_improvements_still_work(self, critic):
         """Legacy string array improvements should still work."""
-        response = json.dumps({
-            "score": 75,
-            "improvements": ["Increase brightness", "Boost contrast"],
-            "notes": "Good shot."
-        })
-
-        result = self.critic._parse_response(response)
+        result = critic._parse_response(LEGACY_RESPONSE)
 
         # Should remain as strings (no conversion)
         assert result["improvements"] == ["Increase brightness", "Boost contrast"]
@@ -293,12 +191,65 @@ class TestBaseCriticParseResponse:
         assert "context" in result
 
 
+class TestDedupeImprovements:
+    """Tests for the improvement deduplication helper."""
+
+    def test_exact_duplicates_collapsed(self):
+        """Identical improvements (ignoring case) should be collapsed."""
+        result = _dedupe_improvements(["Boost contrast", "boost contrast"])
+
+        assert len(result) == 1
+
+    def test_near_duplicates_collapsed(self):
+        """Close paraphrases should be collapsed into one improvement."""
+        result = _dedupe_improvements([
+            "Increase brightness by 20%",
+            "Increase brightness by 20",
+        ])
+
+        assert len(result) == 1
+
+    def test_distinct_improvements_kept(self):
+        """Genuinely different improvements should all survive."""
+        result = _dedupe_improvements([
+            "Lift shadows in the foreground",
+            "Reduce highlights on the sky",
+            "Sharpen the subject's eyes",
+        ])
+
+        assert len(result) == 3
+
+    def test_severity_tags_ignored_for_matching(self):
+        """Severity prefixes should not prevent deduplication."""
+        result = _dedupe_improvements([
+            "[MODERATE] Boost contrast",
+            "[SUBTLE] Boost contrast",
+        ])
+
+        assert len(result) == 1
+
+    def test_preserves_first_seen_order(self):
+        """Output should keep the order improvements first appeared in."""
+        result = _dedupe_improvements([
+            "Lift shadows",
+            "Reduce noise",
+            "lift shadows",
+        ])
+
+        assert result == ["Lift shadows", "Reduce noise"]
+
+    def test_non_strings_skipped(self):
+        """Non-string entries should be dropped rather than crash."""
+        result = _dedupe_improvements(["Boost contrast", None, 42])
+
+        assert result == ["Boost contrast"]
+
+
 class TestBaseCriticGetPrompt:
     """Tests for the _get_prompt method."""
 
-    def test_prompt_contains_required_elements(self):
+    def test_prompt_contains_required_elements(self, critic):
         """Prompt should contain key instructions."""
-        critic = MockCritic()
         prompt = critic._get_prompt()
 
         assert "score" in prompt.lower()
@@ -306,9 +257,8 @@ class TestBaseCriticGetPrompt:
         assert "notes" in prompt.lower()
         assert "json" in prompt.lower()
 
-    def test_prompt_requests_json_only(self):
+    def test_prompt_requests_json_only(self, critic):
         """Prompt should request JSON-only output."""
-        critic = MockCritic()
         prompt = critic._get_prompt()
 
         assert "ONLY valid JSON" in prompt or "only the JSON" in prompt.lower()
@@ -317,29 +267,25 @@ class TestBaseCriticGetPrompt:
 class TestBaseCriticImageHelpers:
     """Tests for image helper methods."""
 
-    def test_get_image_media_type_jpeg(self):
+    def test_get_image_media_type_jpeg(self, critic):
         """JPEG files should return correct media type."""
-        critic = MockCritic()
 
         assert critic._get_image_media_type(Path("test.jpg")) == "image/jpeg"
         assert critic._get_image_media_type(Path("test.jpeg")) == "image/jpeg"
         assert critic._get_image_media_type(Path("TEST.JPG")) == "image/jpeg"
 
-    def test_get_image_media_type_png(self):
+    def test_get_image_media_type_png(self, critic):
         """PNG files should return correct media type."""
-        critic = MockCritic()
 
         assert critic._get_image_media_type(Path("test.png")) == "image/png"
         assert critic._get_image_media_type(Path("TEST.PNG")) == "image/png"
 
-    def test_get_image_media_type_webp(self):
+    def test_get_image_media_type_webp(self, critic):
         """WebP files should return correct media type."""
-        critic = MockCritic()
 
         assert critic._get_image_media_type(Path("test.webp")) == "image/webp"
 
-    def test_get_image_media_type_unknown_defaults_to_jpeg(self):
+    def test_get_image_media_type_unknown_defaults_to_jpeg(self, critic):
         """Unknown file types should default to JPEG."""
-        critic = MockCritic()
 
         assert critic._get_image_media_type(Path("test.unknown")) == "image/jpeg"
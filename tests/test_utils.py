@@ -1,16 +1,24 @@
 """Tests for utils module."""
 
-import sys
-import time
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-# Add scripts to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+from utils import retry_with_backoff, AdaptiveLimiter, is_rate_limit_error
 
-from utils import retry_with_backoff
+
+# Error messages every provider variant of "try again later" reduces to
+RETRYABLE_ERRORS = [
+    "rate limit exceeded",
+    "quota exceeded",
+    "too many requests",
+    "429 error",
+    "timeout error",
+    "temporarily unavailable",
+    "service unavailable",
+    "503 service unavailable",
+    "500 internal server error",
+]
 
 
 class TestRetryWithBackoff:
@@ -76,37 +84,24 @@ class TestRetryWithBackoff:
         assert result == "success"
         assert call_count == 3
 
-    def test_retryable_error_patterns(self):
-        """Various retryable error patterns should trigger retries."""
-        retryable_errors = [
-            "rate limit exceeded",
-            "quota exceeded",
-            "too many requests",
-            "429 error",
-            "timeout error",
-            "temporarily unavailable",
-            "service unavailable",
-            "503 service unavailable",
-            "500 internal server error",
-        ]
-
-        for error_msg in retryable_errors:
-            call_count = 0
-
-            @retry_with_backoff(max_retries=1, initial_delay=0.01)
-            def failing_func():
-                nonlocal call_count
-                call_count += 1
-                raise Exception(error_msg)
+    @pytest.mark.parametrize("error_msg", RETRYABLE_ERRORS)
+    def test_retryable_error_patterns(self, error_msg):
+        """Each retryable error pattern should trigger a retry."""
+        call_count = 0
 
-            with pytest.raises(Exception):
-                failing_func()
+        @retry_with_backoff(max_retries=1, initial_delay=0.01)
+        def failing_func():
+            nonlocal call_count
+            call_count += 1
+            raise Exception(error_msg)
 
-            assert call_count == 2, f"Error '{error_msg}' should have triggered retry"
+        with pytest.raises(Exception):
+            failing_func()
+
+        assert call_count == 2, f"Error '{error_msg}' should have triggered retry"
 
     def test_backoff_factor(self):
-        """Delays should increase with backoff factor."""
-        delays = []
+        """Delays should increase with backoff factor (within jitter)."""
         call_count = 0
 
         @retry_with_backoff(max_retries=2, initial_delay=0.1, backoff_factor=2.0)
@@ -115,15 +110,47 @@ class TestRetryWithBackoff:
             call_count += 1
             raise Exception("rate limit")
 
-        with patch('time.sleep') as mock_sleep:
+        with patch('utils._sleep') as mock_sleep:
             with pytest.raises(Exception):
                 rate_limited_func()
 
-            # Check that sleep was called with increasing delays
+            # Check that sleep was called with increasing, jittered delays
             sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
             assert len(sleep_calls) == 2  # Two retries
-            assert sleep_calls[0] == pytest.approx(0.1, rel=0.1)
-            assert sleep_calls[1] == pytest.approx(0.2, rel=0.1)
+            assert 0.075 <= sleep_calls[0] <= 0.125  # 0.1 +/- 25%
+            assert 0.15 <= sleep_calls[1] <= 0.25  # 0.2 +/- 25%
+
+    def test_retry_after_header_honored(self):
+        """A Retry-After header should override the computed delay."""
+        class FakeResponse:
+            headers = {'retry-after': '0.5'}
+
+        class RateLimitError(Exception):
+            response = FakeResponse()
+
+        @retry_with_backoff(max_retries=1, initial_delay=5.0)
+        def rate_limited_func():
+            raise RateLimitError("429 too many requests")
+
+        with patch('utils._sleep') as mock_sleep:
+            with pytest.raises(RateLimitError):
+                rate_limited_func()
+
+            sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
+            assert sleep_calls == [0.5]
+
+    def test_max_delay_caps_sleep(self):
+        """Sleeps should never exceed max_delay."""
+        @retry_with_backoff(max_retries=1, initial_delay=100.0, max_delay=1.0)
+        def rate_limited_func():
+            raise Exception("rate limit")
+
+        with patch('utils._sleep') as mock_sleep:
+            with pytest.raises(Exception):
+                rate_limited_func()
+
+            sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
+            assert all(s <= 1.25 for s in sleep_calls)  # 1.0 cap + jitter
 
     def test_preserves_function_metadata(self):
         """Decorator should preserve function name and docstring."""
@@ -134,3 +161,68 @@ class TestRetryWithBackoff:
 
         assert my_function.__name__ == "my_function"
         assert my_function.__doc__ == "My docstring."
+
+
+class TestAdaptiveLimiter:
+    """Tests for the AdaptiveLimiter concurrency guard."""
+
+    def test_successful_call_keeps_limit(self):
+        """Successful calls should not change the limit."""
+        limiter = AdaptiveLimiter(4)
+
+        with limiter:
+            pass
+
+        assert limiter.limit == 4
+
+    def test_rate_limit_error_halves_limit(self):
+        """A rate-limit error should halve the concurrency limit."""
+        limiter = AdaptiveLimiter(8)
+
+        with pytest.raises(Exception, match="rate limit"):
+            with limiter:
+                raise Exception("rate limit exceeded")
+
+        assert limiter.limit == 4
+
+    def test_limit_never_drops_below_one(self):
+        """Repeated rate-limit errors should floor the limit at 1."""
+        limiter = AdaptiveLimiter(2)
+
+        for _ in range(5):
+            with pytest.raises(Exception):
+                with limiter:
+                    raise Exception("429 too many requests")
+
+        assert limiter.limit == 1
+
+    def test_non_rate_limit_error_keeps_limit(self):
+        """Unrelated errors should not shrink the limit."""
+        limiter = AdaptiveLimiter(4)
+
+        with pytest.raises(ValueError):
+            with limiter:
+                raise ValueError("something else broke")
+
+        assert limiter.limit == 4
+
+    def test_limit_recovers_after_quiet_period(self):
+        """The limit should creep back up after the recovery interval."""
+        limiter = AdaptiveLimiter(4, recovery_interval=0.0)
+
+        with pytest.raises(Exception):
+            with limiter:
+                raise Exception("quota exceeded")
+        assert limiter.limit == 2
+
+        # Next acquisition happens after the (zero-length) quiet period
+        with limiter:
+            pass
+        assert limiter.limit == 3
+
+    def test_is_rate_limit_error(self):
+        """Rate-limit detection should match provider error messages."""
+        assert is_rate_limit_error(Exception("Rate limit exceeded"))
+        assert is_rate_limit_error(Exception("HTTP 429"))
+        assert is_rate_limit_error(Exception("quota exhausted"))
+        assert not is_rate_limit_error(Exception("connection refused"))